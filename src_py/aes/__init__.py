@@ -1 +1,4 @@
-from .aes import AES
\ No newline at end of file
+from .aes import AES
+from .aes_ttable import AES_TTable
+from .aes_bitslice import AES_Bitsliced
+from .backends import get_backend, register_backend, available_backends
\ No newline at end of file
@@ -12,46 +12,77 @@ class AES:
         # self.modified_aes_512 = False  # to indicate if AES-512 is used
         self.expanded_key = expand_key(bytearray(key), self.key_size, 16 * (self._rounds + 1))
 
+        # Round keys in state layout, built once for both directions
+        self._enc_round_keys = tuple(bytes(create_round_key(self.expanded_key, round_idx))
+                                     for round_idx in range(self._rounds + 1))
+        self._dec_round_keys = self._enc_round_keys[::-1]
+
 
     def encrypt(self, input_bytes: bytes) -> bytes:
         """Encrypt a 16-byte block with AES using the given key."""
+        round_keys = self._enc_round_keys
         state = byte_to_state(bytearray(input_bytes))
 
         # Initial Round
-        state = add_round_key(state, create_round_key(self.expanded_key, 0))
+        state = add_round_key(state, round_keys[0])
 
         # Main Rounds
         for round_idx in range(1, self._rounds):
             state = sub_bytes(state)
             state = shift_rows(state)
             state = mix_columns(state)
-            state = add_round_key(state, create_round_key(self.expanded_key, round_idx))
+            state = add_round_key(state, round_keys[round_idx])
 
         # Final Round (no MixColumns)
         state = sub_bytes(state)
         state = shift_rows(state)
-        state = add_round_key(state, create_round_key(self.expanded_key, self._rounds))
+        state = add_round_key(state, round_keys[self._rounds])
 
         return bytes(state_to_byte(state))
 
 
     def decrypt(self, input_bytes: bytes) -> bytes:
         """Decrypt a 16-byte block with AES using the given key."""
+        round_keys = self._dec_round_keys
         state = byte_to_state(bytearray(input_bytes))
 
         # Initial Round
-        state = add_round_key(state, create_round_key(self.expanded_key, self._rounds))
+        state = add_round_key(state, round_keys[0])
 
         # Main Rounds
-        for round_idx in range(self._rounds - 1, 0, -1):
+        for round_idx in range(1, self._rounds):
             state = inv_shift_rows(state)
             state = inv_sub_bytes(state)
-            state = add_round_key(state, create_round_key(self.expanded_key, round_idx))
+            state = add_round_key(state, round_keys[round_idx])
             state = inv_mix_columns(state)
 
         # Final Round (no InvMixColumns)
         state = inv_shift_rows(state)
         state = inv_sub_bytes(state)
-        state = add_round_key(state, create_round_key(self.expanded_key, 0))
+        state = add_round_key(state, round_keys[self._rounds])
 
         return bytes(state_to_byte(state))
+
+
+    def encrypt_blocks(self, data):
+        """
+        Encrypt N independent 16-byte blocks at once with the NumPy batched engine.
+        Args:
+            data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        Returns:
+            np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+        """
+        from .aes_numpy import encrypt_blocks
+        return encrypt_blocks(data, self.expanded_key, self._rounds)
+
+
+    def decrypt_blocks(self, data):
+        """
+        Decrypt N independent 16-byte blocks at once with the NumPy batched engine.
+        Args:
+            data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        Returns:
+            np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+        """
+        from .aes_numpy import decrypt_blocks
+        return decrypt_blocks(data, self.expanded_key, self._rounds)
@@ -0,0 +1,225 @@
+from .aes import AES
+from .aes_helper import blocks_like_input
+
+# Byte permutations in input (column-major) order: byte r + 4c sits at row r, column c
+_SHIFT_ROWS = [r + 4 * ((c + r) % 4) for c in range(4) for r in range(4)]
+_INV_SHIFT_ROWS = [r + 4 * ((c - r) % 4) for c in range(4) for r in range(4)]
+
+# Each lane word is split into 8 sub-batches so every bit of the lane int is used
+_SUB_BATCHES = 8
+
+
+def _gf_reduce(p):
+    """Reduce a 15-term bitsliced product modulo x^8 + x^4 + x^3 + x + 1."""
+    for k in range(14, 7, -1):
+        t = p[k]
+        p[k - 8] ^= t
+        p[k - 7] ^= t
+        p[k - 5] ^= t
+        p[k - 4] ^= t
+    return p[:8]
+
+
+def _gf_mul(a, b):
+    """Bitsliced GF(2^8) multiplication of two 8-lane bytes."""
+    p = [0] * 15
+    for i in range(8):
+        ai = a[i]
+        for j in range(8):
+            p[i + j] ^= ai & b[j]
+    return _gf_reduce(p)
+
+
+def _gf_square(a):
+    """Bitsliced GF(2^8) squaring (linear: x^i -> x^2i)."""
+    p = [0] * 15
+    for i in range(8):
+        p[2 * i] = a[i]
+    return _gf_reduce(p)
+
+
+def _gf_inverse(a):
+    """Bitsliced multiplicative inverse a^254 in GF(2^8), with 0 -> 0."""
+    a2 = _gf_square(a)
+    a3 = _gf_mul(a2, a)
+    a6 = _gf_square(a3)
+    a12 = _gf_square(a6)
+    a15 = _gf_mul(a12, a3)
+    a240 = a15
+    for _ in range(4):
+        a240 = _gf_square(a240)
+    a252 = _gf_mul(a240, a12)
+    return _gf_mul(a252, a2)
+
+
+def _sub_byte(a, ones):
+    """S-box circuit: GF(2^8) inverse followed by the affine transform (c = 0x63)."""
+    b = _gf_inverse(a)
+    return [b[i] ^ b[(i + 4) % 8] ^ b[(i + 5) % 8] ^ b[(i + 6) % 8] ^ b[(i + 7) % 8] ^
+            (ones if (0x63 >> i) & 1 else 0)
+            for i in range(8)]
+
+
+def _inv_sub_byte(a, ones):
+    """Inverse S-box circuit: inverse affine transform (d = 0x05) followed by GF(2^8) inverse."""
+    b = [a[(i + 2) % 8] ^ a[(i + 5) % 8] ^ a[(i + 7) % 8] ^ (ones if (0x05 >> i) & 1 else 0)
+         for i in range(8)]
+    return _gf_inverse(b)
+
+
+def _xtime(b):
+    """Multiply a bitsliced byte by {02}."""
+    return [b[7], b[0] ^ b[7], b[1], b[2] ^ b[7], b[3] ^ b[7], b[4], b[5], b[6]]
+
+
+def _xor_byte(a, b):
+    return [x ^ y for x, y in zip(a, b)]
+
+
+def _mix_column(column):
+    """MixColumns on one column given as 4 bitsliced bytes."""
+    a0, a1, a2, a3 = column
+    total = _xor_byte(_xor_byte(a0, a1), _xor_byte(a2, a3))
+    return [
+        _xor_byte(_xor_byte(a0, total), _xtime(_xor_byte(a0, a1))),
+        _xor_byte(_xor_byte(a1, total), _xtime(_xor_byte(a1, a2))),
+        _xor_byte(_xor_byte(a2, total), _xtime(_xor_byte(a2, a3))),
+        _xor_byte(_xor_byte(a3, total), _xtime(_xor_byte(a3, a0))),
+    ]
+
+
+def _inv_mix_column(column):
+    """InvMixColumns on one column: a {04}-multiple pre-mix, then MixColumns."""
+    a0, a1, a2, a3 = column
+    u = _xtime(_xtime(_xor_byte(a0, a2)))
+    v = _xtime(_xtime(_xor_byte(a1, a3)))
+    return _mix_column([_xor_byte(a0, u), _xor_byte(a1, v), _xor_byte(a2, u), _xor_byte(a3, v)])
+
+
+class AES_Bitsliced(AES):
+    """
+    Bitsliced AES over Python big integers.
+
+    Many blocks are transposed into 128 lane ints: lane 8*i + j carries bit j
+    of state byte i for every block in the batch. SubBytes is evaluated as a
+    boolean circuit (GF(2^8) inversion + affine map), ShiftRows is a lane
+    permutation and MixColumns is XORs of lanes, so one pass over the
+    circuit encrypts the whole batch without any data-dependent table lookup.
+    """
+
+    def __init__(self, key: bytes):
+        super().__init__(key)
+        # Round key bit (0 or 1) of every lane, per round (input byte order)
+        self._round_key_bits = [
+            [(self.expanded_key[16 * round_idx + i] >> j) & 1 for i in range(16) for j in range(8)]
+            for round_idx in range(self._rounds + 1)
+        ]
+
+    @staticmethod
+    def _pack(data: bytes, width: int):
+        """Transpose blocks into 128 lane ints of `_SUB_BATCHES * width` bits."""
+        spread = int.from_bytes(b'\x01' * width, 'little')
+        span = 16 * width
+        lanes = [0] * 128
+        for sub in range(_SUB_BATCHES):
+            chunk = data[sub * span:(sub + 1) * span]
+            if not chunk:
+                break
+            chunk = chunk.ljust(span, b'\x00')
+            for i in range(16):
+                # Byte i of every block: block k at bits 8k..8k+7
+                column = int.from_bytes(chunk[i::16], 'little')
+                for j in range(8):
+                    lanes[8 * i + j] |= ((column >> j) & spread) << sub
+        return lanes
+
+    @staticmethod
+    def _unpack(lanes, width: int, num_blocks: int) -> bytes:
+        """Inverse of `_pack`."""
+        spread = int.from_bytes(b'\x01' * width, 'little')
+        span = 16 * width
+        out = bytearray(_SUB_BATCHES * span)
+        for sub in range(_SUB_BATCHES):
+            chunk = bytearray(span)
+            for i in range(16):
+                column = 0
+                for j in range(8):
+                    column |= ((lanes[8 * i + j] >> sub) & spread) << j
+                chunk[i::16] = column.to_bytes(width, 'little')
+            out[sub * span:(sub + 1) * span] = chunk
+        return bytes(out[:16 * num_blocks])
+
+    def _round_key_masks(self, ones):
+        """Per round, one mask per lane: `ones` where the key bit is set, else 0 (no branch on key bits)."""
+        return [[-bit & ones for bit in bits] for bits in self._round_key_bits]
+
+    @staticmethod
+    def _add_round_key(lanes, masks):
+        # Every lane is XORed, so the work does not depend on the key's Hamming weight
+        for lane in range(128):
+            lanes[lane] ^= masks[lane]
+
+    def _run(self, data, inverse: bool):
+        raw = bytes(data)
+        if len(raw) % 16 != 0:
+            raise ValueError("Block data length must be a multiple of 16 bytes")
+        num_blocks = len(raw) // 16
+        if num_blocks == 0:
+            return b''
+
+        width = -(-num_blocks // _SUB_BATCHES)
+        ones = (1 << (_SUB_BATCHES * width)) - 1
+        lanes = self._pack(raw, width)
+        rounds = self._rounds
+        key_masks = self._round_key_masks(ones)
+
+        if not inverse:
+            self._add_round_key(lanes, key_masks[0])
+            for round_idx in range(1, rounds + 1):
+                subbed = [_sub_byte(lanes[8 * i:8 * i + 8], ones) for i in range(16)]
+                state = [subbed[_SHIFT_ROWS[i]] for i in range(16)]
+                if round_idx != rounds:
+                    state = [byte for c in range(4) for byte in _mix_column(state[4 * c:4 * c + 4])]
+                lanes = [lane for byte in state for lane in byte]
+                self._add_round_key(lanes, key_masks[round_idx])
+        else:
+            self._add_round_key(lanes, key_masks[rounds])
+            for round_idx in range(rounds - 1, -1, -1):
+                state = [lanes[8 * _INV_SHIFT_ROWS[i]:8 * _INV_SHIFT_ROWS[i] + 8] for i in range(16)]
+                state = [_inv_sub_byte(byte, ones) for byte in state]
+                lanes = [lane for byte in state for lane in byte]
+                self._add_round_key(lanes, key_masks[round_idx])
+                if round_idx != 0:
+                    state = [lanes[8 * i:8 * i + 8] for i in range(16)]
+                    state = [byte for c in range(4) for byte in _inv_mix_column(state[4 * c:4 * c + 4])]
+                    lanes = [lane for byte in state for lane in byte]
+
+        return self._unpack(lanes, width, num_blocks)
+
+    def encrypt(self, input_bytes: bytes) -> bytes:
+        """Encrypt a 16-byte block with AES using the given key."""
+        return self._run(input_bytes, inverse=False)
+
+    def decrypt(self, input_bytes: bytes) -> bytes:
+        """Decrypt a 16-byte block with AES using the given key."""
+        return self._run(input_bytes, inverse=True)
+
+    def encrypt_blocks(self, data):
+        """
+        Encrypt N independent 16-byte blocks in one pass over the bitsliced circuit.
+        Args:
+            data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        Returns:
+            np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+        """
+        return blocks_like_input(data, self._run(data, inverse=False))
+
+    def decrypt_blocks(self, data):
+        """
+        Decrypt N independent 16-byte blocks in one pass over the bitsliced circuit.
+        Args:
+            data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        Returns:
+            np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+        """
+        return blocks_like_input(data, self._run(data, inverse=True))
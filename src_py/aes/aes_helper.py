@@ -333,4 +333,18 @@ def circular_shift_left(key: str, shift: int) -> str:
     Returns:
         str: The shifted key.
     """
-    return key[shift:] + key[:shift]
\ No newline at end of file
+    return key[shift:] + key[:shift]
+
+def blocks_like_input(data, out: bytes):
+    """
+    Return multi-block output in the same form as the input.
+    Args:
+        data: Input given to an `encrypt_blocks` / `decrypt_blocks` call.
+        out (bytes): Raw output bytes.
+    Returns:
+        np.ndarray (N, 16) if `data` is an array, otherwise `out` unchanged.
+    """
+    if hasattr(data, 'reshape') and not isinstance(data, memoryview):
+        import numpy as np
+        return np.frombuffer(out, dtype=np.uint8).reshape(-1, 16).copy()
+    return out
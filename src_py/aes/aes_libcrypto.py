@@ -0,0 +1,129 @@
+import ctypes
+import ctypes.util
+import threading
+
+from .aes_helper import blocks_like_input
+
+_LIBRARY_NAMES = ('crypto', 'libcrypto.so.3', 'libcrypto.so', 'libcrypto.dylib',
+                  'libcrypto-3-x64', 'libcrypto-1_1-x64')
+
+_CIPHER_NAMES = {16: 'EVP_aes_128_ecb', 24: 'EVP_aes_192_ecb', 32: 'EVP_aes_256_ecb'}
+
+
+def _load_libcrypto():
+    """Load the system libcrypto and declare the EVP functions used here, or return None."""
+    for name in _LIBRARY_NAMES:
+        path = ctypes.util.find_library(name) if name == 'crypto' else name
+        if not path:
+            continue
+        try:
+            lib = ctypes.CDLL(path)
+            lib.EVP_CIPHER_CTX_new.restype = ctypes.c_void_p
+            lib.EVP_CIPHER_CTX_new.argtypes = []
+            lib.EVP_CIPHER_CTX_free.restype = None
+            lib.EVP_CIPHER_CTX_free.argtypes = [ctypes.c_void_p]
+            lib.EVP_CipherInit_ex.restype = ctypes.c_int
+            lib.EVP_CipherInit_ex.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+                                              ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+            lib.EVP_CIPHER_CTX_set_padding.restype = ctypes.c_int
+            lib.EVP_CIPHER_CTX_set_padding.argtypes = [ctypes.c_void_p, ctypes.c_int]
+            lib.EVP_CipherUpdate.restype = ctypes.c_int
+            lib.EVP_CipherUpdate.argtypes = [ctypes.c_void_p, ctypes.c_char_p,
+                                             ctypes.POINTER(ctypes.c_int), ctypes.c_char_p, ctypes.c_int]
+            for cipher_name in _CIPHER_NAMES.values():
+                getattr(lib, cipher_name).restype = ctypes.c_void_p
+                getattr(lib, cipher_name).argtypes = []
+        except (OSError, AttributeError):
+            continue
+        return lib
+    return None
+
+
+_libcrypto = _load_libcrypto()
+
+
+def libcrypto_available() -> bool:
+    """Return True if a usable system libcrypto was found."""
+    return _libcrypto is not None
+
+
+class AES_Libcrypto:
+    """
+    AES block cipher backed by the system libcrypto (OpenSSL) through ctypes.
+
+    Uses raw AES-ECB EVP contexts without padding, one per direction, set up
+    once per key. Calls are serialized with a lock since an EVP context must
+    not be used from several threads at once.
+    """
+
+    def __init__(self, key: bytes):
+        if _libcrypto is None:
+            raise RuntimeError("libcrypto is not available on this system")
+        self.key_size = len(key)
+        if self.key_size not in (16, 24, 32):
+            raise ValueError("key_size must be 16, 24, or 32 (bytes).")
+        self._rounds = {16: 10, 24: 12, 32: 14}[self.key_size]
+        self._lock = threading.Lock()
+        cipher = getattr(_libcrypto, _CIPHER_NAMES[self.key_size])()
+        self._enc_ctx = self._new_ctx(cipher, bytes(key), 1)
+        self._dec_ctx = self._new_ctx(cipher, bytes(key), 0)
+
+    @staticmethod
+    def _new_ctx(cipher, key: bytes, enc: int):
+        ctx = _libcrypto.EVP_CIPHER_CTX_new()
+        if not ctx:
+            raise MemoryError("EVP_CIPHER_CTX_new failed")
+        if _libcrypto.EVP_CipherInit_ex(ctx, cipher, None, key, None, enc) != 1:
+            _libcrypto.EVP_CIPHER_CTX_free(ctx)
+            raise RuntimeError("EVP_CipherInit_ex failed")
+        _libcrypto.EVP_CIPHER_CTX_set_padding(ctx, 0)
+        return ctx
+
+    def __del__(self):
+        if _libcrypto is None:
+            return
+        for attr in ('_enc_ctx', '_dec_ctx'):
+            ctx = getattr(self, attr, None)
+            if ctx:
+                _libcrypto.EVP_CIPHER_CTX_free(ctx)
+
+    def _update(self, ctx, data: bytes) -> bytes:
+        if len(data) % 16 != 0:
+            raise ValueError("Block data length must be a multiple of 16 bytes")
+        if not data:
+            return b''
+        out = ctypes.create_string_buffer(len(data))
+        out_len = ctypes.c_int(0)
+        with self._lock:
+            ok = _libcrypto.EVP_CipherUpdate(ctx, out, ctypes.byref(out_len), data, len(data))
+        if ok != 1 or out_len.value != len(data):
+            raise RuntimeError("EVP_CipherUpdate failed")
+        return out.raw
+
+    def encrypt(self, input_bytes: bytes) -> bytes:
+        """Encrypt a 16-byte block with AES using the given key."""
+        return self._update(self._enc_ctx, bytes(input_bytes))
+
+    def decrypt(self, input_bytes: bytes) -> bytes:
+        """Decrypt a 16-byte block with AES using the given key."""
+        return self._update(self._dec_ctx, bytes(input_bytes))
+
+    def encrypt_blocks(self, data):
+        """
+        Encrypt N independent 16-byte blocks in a single libcrypto call.
+        Args:
+            data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        Returns:
+            np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+        """
+        return blocks_like_input(data, self._update(self._enc_ctx, bytes(data)))
+
+    def decrypt_blocks(self, data):
+        """
+        Decrypt N independent 16-byte blocks in a single libcrypto call.
+        Args:
+            data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        Returns:
+            np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+        """
+        return blocks_like_input(data, self._update(self._dec_ctx, bytes(data)))
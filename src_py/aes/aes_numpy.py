@@ -0,0 +1,117 @@
+import numpy as np
+
+from .aes_constant import aes_sbox, aes_rsbox
+from .aes_helper import galois_multiplication
+
+SBOX = np.array(aes_sbox, dtype=np.uint8)
+RSBOX = np.array(aes_rsbox, dtype=np.uint8)
+XTIME = np.array([galois_multiplication(x, 2) for x in range(256)], dtype=np.uint8)
+
+# Byte permutations in input (column-major) order: byte r + 4c sits at row r, column c
+SHIFT_ROWS = np.array([r + 4 * ((c + r) % 4) for c in range(4) for r in range(4)], dtype=np.intp)
+INV_SHIFT_ROWS = np.array([r + 4 * ((c - r) % 4) for c in range(4) for r in range(4)], dtype=np.intp)
+
+# Blocks per NumPy pass, keeps temporaries around 1 MB
+CHUNK_BLOCKS = 1 << 16
+
+
+def as_blocks(data) -> np.ndarray:
+    """
+    View input data as an (N, 16) uint8 array without copying.
+    Args:
+        data: (N, 16) uint8 array, or any buffer whose length is a multiple of 16.
+    Returns:
+        np.ndarray: (N, 16) uint8 view of the data.
+    """
+    arr = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+    if arr.dtype != np.uint8:
+        raise ValueError("Block data must be uint8")
+    if arr.size % 16 != 0:
+        raise ValueError("Block data length must be a multiple of 16 bytes")
+    return arr.reshape(-1, 16)
+
+
+def mix_columns(state: np.ndarray) -> np.ndarray:
+    """Apply MixColumns to every column of an (N, 16) state array."""
+    cols = state.reshape(-1, 4, 4)
+    total = cols[:, :, 0] ^ cols[:, :, 1] ^ cols[:, :, 2] ^ cols[:, :, 3]
+    mixed = cols ^ total[:, :, None] ^ XTIME[cols ^ np.roll(cols, -1, axis=2)]
+    return mixed.reshape(-1, 16)
+
+
+def inv_mix_columns(state: np.ndarray) -> np.ndarray:
+    """Apply InvMixColumns to every column of an (N, 16) state array."""
+    cols = state.reshape(-1, 4, 4).copy()
+    # InvMixColumns = MixColumns after a {04}-multiple pre-mix of opposite bytes
+    u = XTIME[XTIME[cols[:, :, 0] ^ cols[:, :, 2]]]
+    v = XTIME[XTIME[cols[:, :, 1] ^ cols[:, :, 3]]]
+    cols[:, :, 0] ^= u
+    cols[:, :, 1] ^= v
+    cols[:, :, 2] ^= u
+    cols[:, :, 3] ^= v
+    return mix_columns(cols.reshape(-1, 16))
+
+
+def _round_keys(expanded_key, rounds: int) -> np.ndarray:
+    return np.frombuffer(bytes(expanded_key), dtype=np.uint8)[:16 * (rounds + 1)].reshape(rounds + 1, 16)
+
+
+def _encrypt_chunk(state: np.ndarray, round_keys: np.ndarray, rounds: int) -> np.ndarray:
+    state = state ^ round_keys[0]
+    for round_idx in range(1, rounds):
+        # SubBytes and ShiftRows commute, so both are one fancy-index pass
+        state = SBOX[state][:, SHIFT_ROWS]
+        state = mix_columns(state)
+        state ^= round_keys[round_idx]
+    state = SBOX[state][:, SHIFT_ROWS]
+    state ^= round_keys[rounds]
+    return state
+
+
+def _decrypt_chunk(state: np.ndarray, round_keys: np.ndarray, rounds: int) -> np.ndarray:
+    state = state ^ round_keys[rounds]
+    for round_idx in range(rounds - 1, 0, -1):
+        state = RSBOX[state][:, INV_SHIFT_ROWS]
+        state ^= round_keys[round_idx]
+        state = inv_mix_columns(state)
+    state = RSBOX[state][:, INV_SHIFT_ROWS]
+    state ^= round_keys[0]
+    return state
+
+
+def _run(data, expanded_key, rounds: int, chunk_func):
+    blocks = as_blocks(data)
+    round_keys = _round_keys(expanded_key, rounds)
+    out = np.empty_like(blocks)
+    for start in range(0, len(blocks), CHUNK_BLOCKS):
+        end = start + CHUNK_BLOCKS
+        out[start:end] = chunk_func(blocks[start:end], round_keys, rounds)
+    if isinstance(data, np.ndarray):
+        return out
+    return out.tobytes()
+
+
+def encrypt_blocks(data, expanded_key, rounds: int):
+    """
+    Encrypt N independent 16-byte blocks at once.
+    Args:
+        data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        expanded_key: Expanded AES key (`AES.expanded_key`).
+        rounds (int): Number of AES rounds (10, 12 or 14).
+    Returns:
+        np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+    """
+    return _run(data, expanded_key, rounds, _encrypt_chunk)
+
+
+def decrypt_blocks(data, expanded_key, rounds: int):
+    """
+    Decrypt N independent 16-byte blocks at once.
+    Args:
+        data: (N, 16) uint8 array or a buffer whose length is a multiple of 16.
+        expanded_key: Expanded AES key (`AES.expanded_key`).
+        rounds (int): Number of AES rounds (10, 12 or 14).
+    Returns:
+        np.ndarray (N, 16) if `data` is an array, otherwise bytes.
+    """
+    return _run(data, expanded_key, rounds, _decrypt_chunk)
@@ -0,0 +1,137 @@
+import struct
+
+from .aes import AES
+from .aes_constant import aes_sbox, aes_rsbox
+from .aes_helper import galois_multiplication
+
+
+def _rotr8(word):
+    """Rotate a 32-bit word right by 8 bits."""
+    return ((word >> 8) | (word << 24)) & 0xFFFFFFFF
+
+
+def _build_tables():
+    """
+    Build the encryption tables Te0..Te3 and decryption tables Td0..Td3.
+    Te0[x] packs the MixColumns column (2s, s, s, 3s) of s = S(x) into one
+    big-endian word, Td0[x] packs (14s, 9s, 13s, 11s) of s = S^-1(x).
+    Te1..Te3 / Td1..Td3 are byte rotations of Te0 / Td0.
+    """
+    te0, td0 = [], []
+    for x in range(256):
+        s = aes_sbox[x]
+        te0.append((galois_multiplication(s, 2) << 24) | (s << 16) | (s << 8) |
+                   galois_multiplication(s, 3))
+        si = aes_rsbox[x]
+        td0.append((galois_multiplication(si, 14) << 24) | (galois_multiplication(si, 9) << 16) |
+                   (galois_multiplication(si, 13) << 8) | galois_multiplication(si, 11))
+
+    te1 = [_rotr8(w) for w in te0]
+    te2 = [_rotr8(w) for w in te1]
+    te3 = [_rotr8(w) for w in te2]
+    td1 = [_rotr8(w) for w in td0]
+    td2 = [_rotr8(w) for w in td1]
+    td3 = [_rotr8(w) for w in td2]
+    return (te0, te1, te2, te3), (td0, td1, td2, td3)
+
+
+(Te0, Te1, Te2, Te3), (Td0, Td1, Td2, Td3) = _build_tables()
+
+# S-boxes pre-shifted into each byte lane of a word, used by the final round
+_SBOX_LANES = tuple([s << shift for s in aes_sbox] for shift in (24, 16, 8, 0))
+_RSBOX_LANES = tuple([s << shift for s in aes_rsbox] for shift in (24, 16, 8, 0))
+
+_BLOCK = struct.Struct('>4I')
+
+
+def inv_mix_column_word(word):
+    """Apply InvMixColumns to one big-endian column word."""
+    return (Td0[aes_sbox[word >> 24]] ^
+            Td1[aes_sbox[(word >> 16) & 0xFF]] ^
+            Td2[aes_sbox[(word >> 8) & 0xFF]] ^
+            Td3[aes_sbox[word & 0xFF]])
+
+
+class AES_TTable(AES):
+    """
+    AES engine using 32-bit T-tables.
+
+    SubBytes, ShiftRows and MixColumns are merged into four table lookups per
+    column word (Te0..Te3). Decryption uses the equivalent inverse cipher
+    (Td0..Td3) with InvMixColumns applied to the inner round keys once at
+    key setup. Output is bit-identical to the byte-level `AES` class.
+    """
+
+    def __init__(self, key: bytes):
+        super().__init__(key)
+        words = struct.unpack(f'>{4 * (self._rounds + 1)}I', bytes(self.expanded_key))
+        self._enc_words = list(words)
+
+        # Equivalent inverse cipher: reverse round order, InvMixColumns on inner rounds
+        dec_words = []
+        for round_idx in range(self._rounds, -1, -1):
+            round_words = words[4 * round_idx: 4 * round_idx + 4]
+            if 0 < round_idx < self._rounds:
+                round_words = [inv_mix_column_word(w) for w in round_words]
+            dec_words.extend(round_words)
+        self._dec_words = dec_words
+
+    def encrypt(self, input_bytes: bytes) -> bytes:
+        """Encrypt a 16-byte block with AES using the given key."""
+        rk = self._enc_words
+        te0, te1, te2, te3 = Te0, Te1, Te2, Te3
+
+        s0, s1, s2, s3 = _BLOCK.unpack(bytes(input_bytes))
+        s0 ^= rk[0]
+        s1 ^= rk[1]
+        s2 ^= rk[2]
+        s3 ^= rk[3]
+
+        # Main Rounds
+        k = 4
+        for _ in range(1, self._rounds):
+            t0 = te0[s0 >> 24] ^ te1[(s1 >> 16) & 0xFF] ^ te2[(s2 >> 8) & 0xFF] ^ te3[s3 & 0xFF] ^ rk[k]
+            t1 = te0[s1 >> 24] ^ te1[(s2 >> 16) & 0xFF] ^ te2[(s3 >> 8) & 0xFF] ^ te3[s0 & 0xFF] ^ rk[k + 1]
+            t2 = te0[s2 >> 24] ^ te1[(s3 >> 16) & 0xFF] ^ te2[(s0 >> 8) & 0xFF] ^ te3[s1 & 0xFF] ^ rk[k + 2]
+            t3 = te0[s3 >> 24] ^ te1[(s0 >> 16) & 0xFF] ^ te2[(s1 >> 8) & 0xFF] ^ te3[s2 & 0xFF] ^ rk[k + 3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+            k += 4
+
+        # Final Round (SubBytes + ShiftRows only)
+        b0, b1, b2, b3 = _SBOX_LANES
+        return _BLOCK.pack(
+            b0[s0 >> 24] ^ b1[(s1 >> 16) & 0xFF] ^ b2[(s2 >> 8) & 0xFF] ^ b3[s3 & 0xFF] ^ rk[k],
+            b0[s1 >> 24] ^ b1[(s2 >> 16) & 0xFF] ^ b2[(s3 >> 8) & 0xFF] ^ b3[s0 & 0xFF] ^ rk[k + 1],
+            b0[s2 >> 24] ^ b1[(s3 >> 16) & 0xFF] ^ b2[(s0 >> 8) & 0xFF] ^ b3[s1 & 0xFF] ^ rk[k + 2],
+            b0[s3 >> 24] ^ b1[(s0 >> 16) & 0xFF] ^ b2[(s1 >> 8) & 0xFF] ^ b3[s2 & 0xFF] ^ rk[k + 3],
+        )
+
+    def decrypt(self, input_bytes: bytes) -> bytes:
+        """Decrypt a 16-byte block with AES using the given key."""
+        rk = self._dec_words
+        td0, td1, td2, td3 = Td0, Td1, Td2, Td3
+
+        s0, s1, s2, s3 = _BLOCK.unpack(bytes(input_bytes))
+        s0 ^= rk[0]
+        s1 ^= rk[1]
+        s2 ^= rk[2]
+        s3 ^= rk[3]
+
+        # Main Rounds
+        k = 4
+        for _ in range(1, self._rounds):
+            t0 = td0[s0 >> 24] ^ td1[(s3 >> 16) & 0xFF] ^ td2[(s2 >> 8) & 0xFF] ^ td3[s1 & 0xFF] ^ rk[k]
+            t1 = td0[s1 >> 24] ^ td1[(s0 >> 16) & 0xFF] ^ td2[(s3 >> 8) & 0xFF] ^ td3[s2 & 0xFF] ^ rk[k + 1]
+            t2 = td0[s2 >> 24] ^ td1[(s1 >> 16) & 0xFF] ^ td2[(s0 >> 8) & 0xFF] ^ td3[s3 & 0xFF] ^ rk[k + 2]
+            t3 = td0[s3 >> 24] ^ td1[(s2 >> 16) & 0xFF] ^ td2[(s1 >> 8) & 0xFF] ^ td3[s0 & 0xFF] ^ rk[k + 3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+            k += 4
+
+        # Final Round (InvSubBytes + InvShiftRows only)
+        b0, b1, b2, b3 = _RSBOX_LANES
+        return _BLOCK.pack(
+            b0[s0 >> 24] ^ b1[(s3 >> 16) & 0xFF] ^ b2[(s2 >> 8) & 0xFF] ^ b3[s1 & 0xFF] ^ rk[k],
+            b0[s1 >> 24] ^ b1[(s0 >> 16) & 0xFF] ^ b2[(s3 >> 8) & 0xFF] ^ b3[s2 & 0xFF] ^ rk[k + 1],
+            b0[s2 >> 24] ^ b1[(s1 >> 16) & 0xFF] ^ b2[(s0 >> 8) & 0xFF] ^ b3[s3 & 0xFF] ^ rk[k + 2],
+            b0[s3 >> 24] ^ b1[(s2 >> 16) & 0xFF] ^ b2[(s1 >> 8) & 0xFF] ^ b3[s0 & 0xFF] ^ rk[k + 3],
+        )
@@ -0,0 +1,93 @@
+from .aes import AES
+from .aes_ttable import AES_TTable
+from .aes_bitslice import AES_Bitsliced
+from .aes_libcrypto import AES_Libcrypto, libcrypto_available
+from .aes_helper import blocks_like_input
+
+# Order tried by the "auto" backend, fastest first
+AUTO_ORDER = ("libcrypto", "numpy", "ttable", "reference")
+
+
+class _SerialBlocks:
+    """Run the multi-block API one block at a time through `encrypt` / `decrypt`."""
+
+    def encrypt_blocks(self, data):
+        raw = bytes(data)
+        out = b''.join([self.encrypt(raw[i:i + 16]) for i in range(0, len(raw), 16)])
+        return blocks_like_input(data, out)
+
+    def decrypt_blocks(self, data):
+        raw = bytes(data)
+        out = b''.join([self.decrypt(raw[i:i + 16]) for i in range(0, len(raw), 16)])
+        return blocks_like_input(data, out)
+
+
+class ReferenceBackend(_SerialBlocks, AES):
+    """Byte-level reference AES for every call; the correctness oracle."""
+
+
+class TTableBackend(_SerialBlocks, AES_TTable):
+    """T-table AES for every call, no NumPy required."""
+
+
+class NumPyBackend(AES_TTable):
+    """T-table AES for single blocks, NumPy batched engine for multi-block calls."""
+
+
+def _numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# name -> (factory(key), availability check)
+_BACKENDS = {}
+
+
+def register_backend(name: str, factory, is_available=None) -> None:
+    """
+    Register a block-cipher backend.
+    Args:
+        name (str): Backend name used by `get_backend`.
+        factory: Callable taking the key bytes and returning an object with
+            `key_size`, `encrypt`, `decrypt`, `encrypt_blocks` and `decrypt_blocks`.
+        is_available: Optional callable returning False when the backend cannot run here.
+    """
+    _BACKENDS[name] = (factory, is_available or (lambda: True))
+
+
+def available_backends() -> list:
+    """Return the names of registered backends that can run on this system."""
+    return [name for name, (_, is_available) in _BACKENDS.items() if is_available()]
+
+
+def get_backend(name: str, key: bytes):
+    """
+    Build a block-cipher backend for the given key.
+    Args:
+        name (str): Registered backend name, or "auto" for the fastest available one.
+        key (bytes): AES key (16, 24 or 32 bytes).
+    Returns:
+        Backend instance bound to the key.
+    """
+    if name == "auto":
+        for candidate in AUTO_ORDER:
+            if candidate in _BACKENDS and _BACKENDS[candidate][1]():
+                return _BACKENDS[candidate][0](key)
+        raise RuntimeError("No AES backend available")
+
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown AES backend '{name}', expected one of {sorted(_BACKENDS)} or 'auto'")
+    factory, is_available = _BACKENDS[name]
+    if not is_available():
+        raise RuntimeError(f"AES backend '{name}' is not available on this system")
+    return factory(key)
+
+
+register_backend("reference", ReferenceBackend)
+register_backend("ttable", TTableBackend)
+register_backend("numpy", NumPyBackend, _numpy_available)
+register_backend("bitsliced", AES_Bitsliced)
+register_backend("libcrypto", AES_Libcrypto, libcrypto_available)
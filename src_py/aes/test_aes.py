@@ -0,0 +1,85 @@
+import os
+
+from .aes import AES
+from .aes_ttable import AES_TTable
+from .aes_bitslice import AES_Bitsliced
+from .backends import get_backend, available_backends
+
+
+def run_test():
+    # FIPS-197 Appendix C example vectors
+    vectors = [
+        {
+            "name": "FIPS-197 C.1: AES-128",
+            "key": "000102030405060708090a0b0c0d0e0f",
+            "pt":  "00112233445566778899aabbccddeeff",
+            "ct":  "69c4e0d86a7b0430d8cdb78070b4c55a",
+        },
+        {
+            "name": "FIPS-197 C.2: AES-192",
+            "key": "000102030405060708090a0b0c0d0e0f1011121314151617",
+            "pt":  "00112233445566778899aabbccddeeff",
+            "ct":  "dda97ca4864cdfe06eaf70a0ec0d7191",
+        },
+        {
+            "name": "FIPS-197 C.3: AES-256",
+            "key": "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f",
+            "pt":  "00112233445566778899aabbccddeeff",
+            "ct":  "8ea2b7ca516745bfeafc49904b496089",
+        },
+    ]
+    engines = [("AES", AES), ("AES_TTable", AES_TTable), ("AES_Bitsliced", AES_Bitsliced)]
+
+    print(f"{'TEST NAME':<50} | {'ENGINE':<14} | {'ENC':<6} | {'DEC':<6}")
+
+    for v in vectors:
+        key = bytes.fromhex(v["key"])
+        pt = bytes.fromhex(v["pt"])
+
+        for engine_name, engine in engines:
+            aes = engine(key)
+            ct_out = aes.encrypt(pt)
+            enc_check = "PASS" if ct_out.hex() == v["ct"] else "FAIL"
+            dec_check = "PASS" if aes.decrypt(ct_out) == pt else "FAIL"
+            print(f"{v['name']:<50} | {engine_name:<14} | {enc_check:<6} | {dec_check:<6}")
+
+    # Cross-check every engine against the byte-level reference on random blocks
+    for key_size in (16, 24, 32):
+        key = os.urandom(key_size)
+        reference = AES(key)
+        blocks = [os.urandom(16) for _ in range(32)]
+        expected = [reference.encrypt(b) for b in blocks]
+
+        for engine_name, engine in engines[1:]:
+            aes = engine(key)
+            enc_ok = all(aes.encrypt(b) == c for b, c in zip(blocks, expected))
+            dec_ok = all(aes.decrypt(c) == b for b, c in zip(blocks, expected))
+            name = f"Random blocks vs reference: AES-{key_size * 8}"
+            print(f"{name:<50} | {engine_name:<14} | "
+                  f"{('PASS' if enc_ok else 'FAIL'):<6} | {('PASS' if dec_ok else 'FAIL'):<6}")
+
+        # Multi-block APIs must match the single-block path
+        for engine_name, engine in (("AES", AES), ("AES_Bitsliced", AES_Bitsliced)):
+            aes = engine(key)
+            batch = aes.encrypt_blocks(b"".join(blocks))
+            enc_ok = batch == b"".join(expected)
+            dec_ok = aes.decrypt_blocks(batch) == b"".join(blocks)
+            name = f"encrypt_blocks vs encrypt: AES-{key_size * 8}"
+            print(f"{name:<50} | {engine_name:<14} | "
+                  f"{('PASS' if enc_ok else 'FAIL'):<6} | {('PASS' if dec_ok else 'FAIL'):<6}")
+
+    # Every registered backend must agree with the FIPS-197 vectors, single- and multi-block
+    for v in vectors:
+        key = bytes.fromhex(v["key"])
+        pt = bytes.fromhex(v["pt"])
+
+        for backend in available_backends():
+            aes = get_backend(backend, key)
+            enc_ok = aes.encrypt(pt).hex() == v["ct"] and aes.encrypt_blocks(pt * 3).hex() == v["ct"] * 3
+            dec_ok = aes.decrypt_blocks(bytes.fromhex(v["ct"] * 3)) == pt * 3
+            print(f"{v['name']:<50} | {backend:<14} | "
+                  f"{('PASS' if enc_ok else 'FAIL'):<6} | {('PASS' if dec_ok else 'FAIL'):<6}")
+
+
+if __name__ == "__main__":
+    run_test()
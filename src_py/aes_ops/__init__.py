@@ -1,3 +1,12 @@
-from .aes_cbc import AES_CBC, encrypt_cbc, decrypt_cbc
-from .aes_gcm import AES_GCM
-from .aes_ecb import encrypt_ecb, decrypt_ecb
\ No newline at end of file
+from .aes_cbc import AES_CBC, encrypt_cbc, decrypt_cbc, encrypt_cbc_into, decrypt_cbc_into, encrypt_cbc_many
+from .aes_cbc_stream import CBCEncryptor, CBCDecryptor
+from .aes_cbc_parallel import decrypt_cbc_parallel
+from .aes_gcm import AES_GCM, AES_GCM_Key, seal_many, open_many
+from .aes_gcm_stream import GCMEncryptor, GCMDecryptor
+from .aes_gcm_parallel import AES_GCM_Parallel
+from .aes_ocb import AES_OCB
+from .aes_ctr import AES_CTR, encrypt_ctr, decrypt_ctr
+from .ctr_prefetch import KeystreamPrefetcher
+from .aes_ecb import encrypt_ecb, decrypt_ecb, encrypt_ecb_into, decrypt_ecb_into, encrypt_ecb_aes, decrypt_ecb_aes
+from .aes_ecb_parallel import encrypt_ecb_parallel, decrypt_ecb_parallel
+from .key_cache import KeyContextCache, default_key_cache
\ No newline at end of file
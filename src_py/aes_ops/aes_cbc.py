@@ -1,7 +1,10 @@
 import os
 
 from src_py.aes import AES
-from src_py.aes_ops.helper import xor_bytes, pkcs7_pad, pkcs7_unpad
+from src_py.aes_ops.buffer_ops import as_bytes_view, writable_view, xor_bytes, xor_into
+from src_py.aes_ops.helper import pkcs7_last_block, pkcs7_unpad
+from src_py.aes_ops.aes_cbc_stream import CBCEncryptor, CBCDecryptor
+from src_py.aes_ops.key_cache import cached_backend
 
 
 class AES_CBC:
@@ -9,76 +12,216 @@ class AES_CBC:
         self.aes_cbc = aes
         self.block_size = 16  # AES block size is always 16 bytes
 
+    # Blocks decrypted per multi-block call in decrypt_into
+    DECRYPT_CHUNK_BLOCKS = 1 << 16
+
+    def _check_params(self, key: bytes, iv: bytes) -> None:
+        if len(iv) != self.block_size:
+            raise ValueError(f"IV must be {self.block_size} bytes")
+
+        if len(key) != self.aes_cbc.key_size:
+            raise ValueError(f"Key must be {self.aes_cbc.key_size} bytes")
+
     def encrypt(self, plaintext: bytes, key: bytes, iv: bytes = None) -> tuple:
         """
         Returns:
             tuple: (ciphertext, iv)
         """
+        ciphertext = bytearray((len(plaintext) // self.block_size + 1) * self.block_size)
+        _, iv = self.encrypt_into(plaintext, ciphertext, key, iv)
+        return bytes(ciphertext), iv
+
+    def encrypt_into(self, plaintext, out, key: bytes, iv: bytes = None) -> tuple:
+        """
+        Encrypt into a caller-provided buffer.
+        Args:
+            plaintext: Any buffer-protocol source (bytes, bytearray, memoryview, ndarray, mmap).
+            out: Writable buffer of at least (len(plaintext) // 16 + 1) * 16 bytes.
+                May be the plaintext buffer itself (in-place) if it has room for the padding.
+            key (bytes): AES key, checked against the cipher key size.
+            iv (bytes): 16-byte IV, random if None.
+        Returns:
+            tuple: (bytes written, iv)
+        """
         if iv is None:
             iv = os.urandom(self.block_size)
 
-        if len(iv) != self.block_size:
-            raise ValueError(f"IV must be {self.block_size} bytes")
+        self._check_params(key, iv)
 
-        if len(key) != self.aes_cbc.key_size:
-            raise ValueError(f"Key must be {self.aes_cbc.key_size} bytes")
+        # Only the last block is padded; whole blocks are read in place
+        source = as_bytes_view(plaintext)
+        full_len, last_block = pkcs7_last_block(source, self.block_size)
+        total = full_len + self.block_size
+        dest = writable_view(out, total)
 
-        # Pad plaintext to block size
-        padded_plaintext = pkcs7_pad(plaintext, self.block_size)
+        previous_block = self._encrypt_chain(source[:full_len], dest, iv)
+        self._encrypt_chain(last_block, dest[full_len:], previous_block)
+        return total, iv
 
-        ciphertext = b''
-        previous_block = iv
+    def _encrypt_chain(self, source, dest, previous_block: bytes) -> bytes:
+        """Encrypt the whole blocks of `source` into `dest` chained from `previous_block`; returns the last ciphertext block."""
+        encrypt = self.aes_cbc.encrypt
 
         # Process each block
-        for i in range(0, len(padded_plaintext), self.block_size):
-            block = padded_plaintext[i:i + self.block_size]
-            # XOR with previous ciphertext block (or IV for first block)
-            xored_block = xor_bytes(block, previous_block)
-            # Encrypt the XORed block
-            encrypted_block = self.aes_cbc.encrypt(bytearray(xored_block))
-            ciphertext += bytes(encrypted_block)
-            previous_block = encrypted_block
-
-        return ciphertext, iv
+        for i in range(0, len(source), self.block_size):
+            # XOR with previous ciphertext block (or IV for first block), then encrypt
+            previous_block = encrypt(xor_bytes(source[i:i + self.block_size], previous_block))
+            dest[i:i + self.block_size] = previous_block
+        return previous_block
 
     def decrypt(self, ciphertext: bytes, key: bytes, iv: bytes) -> bytes:
         """
         Returns:
             bytes: Decrypted plaintext
         """
-        if len(iv) != self.block_size:
-            raise ValueError(f"IV must be {self.block_size} bytes")
+        plaintext = bytearray(len(ciphertext))
+        written = self.decrypt_into(ciphertext, plaintext, key, iv)
+        return bytes(memoryview(plaintext)[:written])
 
-        if len(key) != self.aes_cbc.key_size:
-            raise ValueError(f"Key must be {self.aes_cbc.key_size} bytes")
+    def decrypt_into(self, ciphertext, out, key: bytes, iv: bytes) -> int:
+        """
+        Decrypt into a caller-provided buffer.
+        Args:
+            ciphertext: Any buffer-protocol source, a multiple of 16 bytes.
+            out: Writable buffer of at least len(ciphertext) bytes; may be the
+                ciphertext buffer itself (in-place).
+            key (bytes): AES key, checked against the cipher key size.
+            iv (bytes): 16-byte IV.
+        Returns:
+            int: Length of the unpadded plaintext written at the start of `out`.
+        """
+        self._check_params(key, iv)
 
-        if len(ciphertext) % self.block_size != 0:
+        source = as_bytes_view(ciphertext)
+        n = len(source)
+        if n % self.block_size != 0:
             raise ValueError("Ciphertext length must be multiple of block size")
+        dest = writable_view(out, n)
 
-        plaintext = b''
-        previous_block = iv
-
-        # Process each block
-        for i in range(0, len(ciphertext), self.block_size):
-            block = ciphertext[i:i + self.block_size]
-            # Decrypt the block
-            decrypted_block = self.aes_cbc.decrypt(bytearray(block))
-            # XOR with previous ciphertext block (or IV for first block)
-            plaintext_block = xor_bytes(bytes(decrypted_block), previous_block)
-            plaintext += plaintext_block
-            previous_block = block
+        self._decrypt_chain(source, dest, bytes(iv))
 
         # Remove padding
-        return pkcs7_unpad(plaintext)
+        return n - self.block_size + len(pkcs7_unpad(bytes(dest[n - self.block_size:n])))
+
+    def _decrypt_chain(self, source, dest, previous_block: bytes) -> bytes:
+        """Decrypt the whole blocks of `source` into `dest` chained from `previous_block`; returns the last ciphertext block."""
+        # Each P_i = D(C_i) XOR C_{i-1} only depends on ciphertext, so runs of
+        # blocks go through the batched engine at once with one bulk chaining XOR
+        chunk = self.DECRYPT_CHUNK_BLOCKS * self.block_size
+        for start in range(0, len(source), chunk):
+            block = bytes(source[start:start + chunk])
+            decrypted = bytearray(self.aes_cbc.decrypt_blocks(block))
+            xor_into(decrypted, previous_block + block[:-self.block_size])
+            previous_block = block[-self.block_size:]
+            dest[start:start + len(block)] = decrypted
+        return previous_block
+
+    def encrypt_many(self, jobs, key: bytes) -> list:
+        """
+        Encrypt several independent messages under this key in lock-step.
+        CBC chains are serial within a message, but step j of every message is
+        independent of the others: all chains advance together with one
+        multi-block call per step instead of one single-block call per block.
+        Args:
+            jobs: Iterable of (plaintext, iv) pairs; iv may be None (random).
+            key (bytes): AES key, checked against the cipher key size.
+        Returns:
+            list: (ciphertext, iv) per job, identical to `encrypt` on each job.
+        """
+        import numpy as np
+
+        jobs = [(plaintext, os.urandom(self.block_size) if iv is None else iv) for plaintext, iv in jobs]
+        for _, iv in jobs:
+            self._check_params(key, iv)
+        if not jobs:
+            return []
+
+        # Longest messages first, so the chains still running at step j are a prefix
+        blocks = [len(plaintext) // self.block_size + 1 for plaintext, _ in jobs]
+        order = sorted(range(len(jobs)), key=lambda i: -blocks[i])
+        steps = blocks[order[0]]
+
+        padded = np.zeros((len(jobs), steps, self.block_size), dtype=np.uint8)
+        chain = np.empty((len(jobs), self.block_size), dtype=np.uint8)
+        active = [0] * steps
+        for row, i in enumerate(order):
+            plaintext, iv = jobs[i]
+            full_len, last_block = pkcs7_last_block(as_bytes_view(plaintext), self.block_size)
+            flat = padded[row].reshape(-1)
+            flat[:full_len] = np.frombuffer(plaintext, dtype=np.uint8, count=full_len)
+            flat[full_len:full_len + self.block_size] = np.frombuffer(last_block, dtype=np.uint8)
+            chain[row] = np.frombuffer(iv, dtype=np.uint8)
+            for j in range(blocks[i]):
+                active[j] += 1
+
+        encrypt_blocks = self.aes_cbc.encrypt_blocks
+        for j in range(steps):
+            k = active[j]
+            x = np.bitwise_xor(padded[:k, j], chain[:k])
+            chain[:k] = np.frombuffer(encrypt_blocks(x.tobytes()), dtype=np.uint8).reshape(k, self.block_size)
+            padded[:k, j] = chain[:k]
+
+        results = [None] * len(jobs)
+        for row, i in enumerate(order):
+            results[i] = (padded[row, :blocks[i]].tobytes(), bytes(jobs[i][1]))
+        return results
+
+    def encryptor(self, key: bytes, iv: bytes = None) -> CBCEncryptor:
+        """Start a streaming encryption; the IV (random if None) is `encryptor.iv`."""
+        if iv is None:
+            iv = os.urandom(self.block_size)
+        self._check_params(key, iv)
+        return CBCEncryptor(self, iv)
+
+    def decryptor(self, key: bytes, iv: bytes) -> CBCDecryptor:
+        """Start a streaming decryption."""
+        self._check_params(key, iv)
+        return CBCDecryptor(self, iv)
 
 
-def encrypt_cbc(plaintext: bytes, key: bytes, iv: bytes = None) -> tuple:
-    aes_instance = AES(key)
+def encrypt_cbc(plaintext: bytes, key: bytes, iv: bytes = None, backend: str = "auto") -> tuple:
+    aes_instance = cached_backend(key, backend)
     aes_cbc = AES_CBC(aes_instance)
     return aes_cbc.encrypt(plaintext, key, iv)
 
 
-def decrypt_cbc(ciphertext: bytes, key: bytes, iv: bytes) -> bytes:
-    aes_instance = AES(key)
+def decrypt_cbc(ciphertext: bytes, key: bytes, iv: bytes, backend: str = "auto") -> bytes:
+    aes_instance = cached_backend(key, backend)
     aes_cbc = AES_CBC(aes_instance)
     return aes_cbc.decrypt(ciphertext, key, iv)
+
+
+def encrypt_cbc_many(jobs, backend: str = "auto") -> list:
+    """
+    Multi-stream CBC encryption.
+    Args:
+        jobs: Iterable of (plaintext, key, iv) tuples; iv may be None (random).
+            Jobs sharing a key advance in lock-step through the batched engine.
+        backend (str): Block-cipher backend name.
+    Returns:
+        list: (ciphertext, iv) per job, in input order.
+    """
+    jobs = list(jobs)
+    by_key = {}
+    for index, (_, key, _) in enumerate(jobs):
+        by_key.setdefault(bytes(key), []).append(index)
+
+    results = [None] * len(jobs)
+    for key, indices in by_key.items():
+        aes_cbc = AES_CBC(cached_backend(key, backend))
+        group = aes_cbc.encrypt_many([(jobs[i][0], jobs[i][2]) for i in indices], key)
+        for i, result in zip(indices, group):
+            results[i] = result
+    return results
+
+
+def encrypt_cbc_into(plaintext, out, key: bytes, iv: bytes = None, backend: str = "auto") -> tuple:
+    aes_instance = cached_backend(key, backend)
+    aes_cbc = AES_CBC(aes_instance)
+    return aes_cbc.encrypt_into(plaintext, out, key, iv)
+
+
+def decrypt_cbc_into(ciphertext, out, key: bytes, iv: bytes, backend: str = "auto") -> int:
+    aes_instance = cached_backend(key, backend)
+    aes_cbc = AES_CBC(aes_instance)
+    return aes_cbc.decrypt_into(ciphertext, out, key, iv)
@@ -0,0 +1,56 @@
+from src_py.aes import get_backend
+from src_py.aes_ops.aes_cbc import decrypt_cbc
+from src_py.aes_ops.buffer_ops import xor_into
+from src_py.aes_ops.helper import pkcs7_unpad
+from src_py.aes_ops.process_pool import (
+    attach, map_chunks, pool_settings, shared_buffers, start_pool, use_serial, worker_context,
+)
+
+
+def _decrypt_chunk(start: int, end: int, in_name: str, out_name: str, iv: bytes) -> None:
+    """Worker task: P[start:end] = D(C[start:end]) XOR C[start-16:end-16] (IV for the first block)."""
+    with attach(in_name, out_name) as (shm_in, shm_out):
+        previous = iv if start == 0 else bytes(shm_in.buf[start - 16:start])
+        block = bytes(shm_in.buf[start:end])
+        out = bytearray(worker_context().decrypt_blocks(block))
+        xor_into(out, previous + block[:-16])
+        shm_out.buf[start:end] = out
+
+
+def decrypt_cbc_parallel(ciphertext: bytes, key: bytes, iv: bytes, workers: int = None,
+                         backend: str = "auto", chunk_size: int = 1 << 20) -> bytes:
+    """
+    CBC decryption partitioned across a process pool.
+
+    Every plaintext block only depends on C_i and C_{i-1}, so each worker
+    decrypts a block-aligned range with the batched engine and applies the
+    chaining XOR against the ciphertext shifted by one block. Ciphertext and
+    plaintext are exchanged through shared memory.
+
+    Args:
+        ciphertext (bytes): CBC ciphertext, a multiple of 16 bytes.
+        key (bytes): AES key.
+        iv (bytes): 16-byte IV.
+        workers (int): Number of worker processes (default: os.cpu_count()).
+        backend (str): Block-cipher backend name used by the workers.
+        chunk_size (int): Upper bound in bytes of one worker task.
+    Returns:
+        bytes: Decrypted, unpadded plaintext (same as `decrypt_cbc`).
+    """
+    workers, chunk_size = pool_settings(workers, chunk_size)
+    n = len(ciphertext)
+    if use_serial(n, workers, chunk_size):
+        return decrypt_cbc(ciphertext, key, iv, backend=backend)
+
+    if len(iv) != 16:
+        raise ValueError("IV must be 16 bytes")
+    if n % 16 != 0:
+        raise ValueError("Ciphertext length must be multiple of block size")
+
+    with shared_buffers(n, 2) as (shm_in, shm_out):
+        shm_in.buf[:n] = ciphertext
+        with start_pool(workers, get_backend, backend, bytes(key)) as pool:
+            map_chunks(pool, _decrypt_chunk, n, workers, chunk_size, shm_in.name, shm_out.name, iv)
+        plaintext = bytes(shm_out.buf[:n])
+
+    return pkcs7_unpad(plaintext)
@@ -0,0 +1,103 @@
+from src_py.aes_ops.buffer_ops import as_bytes_view
+from src_py.aes_ops.helper import pkcs7_last_block, pkcs7_unpad
+
+
+class _CBCStream:
+    """
+    Incremental CBC over an `AES_CBC` context.
+
+    Carries the chaining value and the bytes of the not yet processed block
+    between calls, so memory stays at one chunk plus one block.
+    """
+
+    def __init__(self, cbc, iv: bytes) -> None:
+        self._cbc = cbc
+        self.iv = bytes(iv)
+        self._previous = self.iv
+        self._pending = b''
+        self._finalized = False
+
+    def _split(self, data, hold_back: bool):
+        """
+        Queue `data` behind the pending bytes and return (head, body, out):
+        `head` completes the pending block (or is empty), `body` is a view of
+        the following whole blocks of `data`, `out` is sized for both.
+        With `hold_back`, the last complete block stays pending.
+        """
+        if self._finalized:
+            raise ValueError("CBC stream already finalized")
+        view = as_bytes_view(data)
+        pending = len(self._pending)
+        total = pending + len(view)
+        size = (total - 1 if hold_back else total) // 16 * 16 if total else 0
+
+        if size == 0:
+            self._pending += bytes(view)
+            return b'', view[:0], bytearray()
+
+        head = b''
+        start = 0
+        if pending:
+            start = 16 - pending
+            head = self._pending + bytes(view[:start])
+        end = size - pending
+        self._pending = bytes(view[end:])
+        return head, view[start:end], bytearray(size)
+
+
+class CBCEncryptor(_CBCStream):
+    """Streaming CBC encryption: `update(data)`*, then `finalize()` for the padded last block."""
+
+    def update(self, data) -> bytes:
+        """Encrypt the next chunk; returns the ciphertext of every block completed so far."""
+        head, body, out = self._split(data, hold_back=False)
+        dest = memoryview(out)
+        if head:
+            self._previous = self._cbc._encrypt_chain(head, dest, self._previous)
+        self._previous = self._cbc._encrypt_chain(body, dest[len(head):], self._previous)
+        return bytes(out)
+
+    def finalize(self) -> bytes:
+        """Apply PKCS#7 to the remaining bytes and return the last ciphertext block."""
+        if self._finalized:
+            raise ValueError("CBC stream already finalized")
+        _, last_block = pkcs7_last_block(self._pending)
+        out = bytearray(16)
+        self._previous = self._cbc._encrypt_chain(last_block, out, self._previous)
+        self._pending = b''
+        self._finalized = True
+        return bytes(out)
+
+
+class CBCDecryptor(_CBCStream):
+    """
+    Streaming CBC decryption: `update(data)`*, then `finalize()`.
+
+    The last complete block is always held back, since only `finalize` knows
+    it carries the padding.
+    """
+
+    def update(self, data) -> bytes:
+        """Decrypt the next chunk; returns plaintext for all but the last complete block."""
+        head, body, out = self._split(data, hold_back=True)
+        dest = memoryview(out)
+        if head:
+            self._previous = self._cbc._decrypt_chain(head, dest, self._previous)
+        self._previous = self._cbc._decrypt_chain(body, dest[len(head):], self._previous)
+        return bytes(out)
+
+    def finalize(self) -> bytes:
+        """
+        Decrypt the held-back block and strip the padding.
+        Raises:
+            ValueError: If the total ciphertext length is not a positive multiple of 16 or the padding is invalid.
+        """
+        if self._finalized:
+            raise ValueError("CBC stream already finalized")
+        if len(self._pending) != 16:
+            raise ValueError("Ciphertext length must be multiple of block size")
+        out = bytearray(16)
+        self._cbc._decrypt_chain(self._pending, out, self._previous)
+        self._pending = b''
+        self._finalized = True
+        return pkcs7_unpad(bytes(out))
@@ -0,0 +1,165 @@
+from src_py.aes_ops.buffer_ops import as_bytes_view, writable_view, xor_into
+from src_py.aes_ops.helper import counter_blocks
+from src_py.aes_ops.key_cache import cached_backend
+
+# Counter blocks encrypted per multi-block call
+CTR_CHUNK_BLOCKS = 4096
+
+COUNTER_BITS = (32, 64, 128)
+
+
+def ctr_keystream(aes, icb: bytes, offset: int, length: int, counter_bits: int = 32) -> bytes:
+    """
+    Keystream bytes [offset, offset + length) for the counter sequence starting at `icb`.
+    Args:
+        aes: Block-cipher backend with `encrypt_blocks`.
+        icb (bytes): 16-byte initial counter block.
+        offset (int): Byte position in the keystream.
+        length (int): Number of bytes.
+        counter_bits (int): Width of the counter field (32, 64 or 128); it wraps modulo 2^counter_bits.
+    """
+    if length <= 0:
+        return b''
+    first = offset // 16
+    skip = offset % 16
+    count = (skip + length + 15) // 16
+    keystream = aes.encrypt_blocks(counter_blocks(icb, count, first, counter_bits))
+    return bytes(keystream)[skip:skip + length]
+
+
+def ctr_xor_into(aes, icb: bytes, source, dest, offset: int = 0, counter_bits: int = 32,
+                 chunk_blocks: int = CTR_CHUNK_BLOCKS) -> None:
+    """
+    dest[:] = source XOR keystream[offset:offset + len(source)].
+
+    Args:
+        aes: Block-cipher backend with `encrypt_blocks`.
+        icb (bytes): 16-byte initial counter block.
+        source: Flat byte view of the input.
+        dest: Flat writable byte view of the same length; may alias `source`.
+        offset (int): Byte position of source[0] in the keystream.
+        counter_bits (int): Width of the counter field (32, 64 or 128).
+        chunk_blocks (int): Counter blocks encrypted per multi-block call.
+    """
+    size = len(source)
+    if not size:
+        return
+    dest[:] = source
+
+    # Keystream for a run of counter blocks comes from one multi-block call,
+    # then is XORed in place into the output
+    first = offset // 16
+    skip = offset % 16
+    n = (skip + size + 15) // 16
+    for block in range(0, n, chunk_blocks):
+        count = min(chunk_blocks, n - block)
+        keystream = aes.encrypt_blocks(counter_blocks(icb, count, first + block, counter_bits))
+        start = block * 16 - skip
+        if start < 0:
+            xor_into(dest[:count * 16 + start], memoryview(keystream)[-start:])
+        else:
+            xor_into(dest[start:start + count * 16], keystream)
+
+
+class AES_CTR:
+    """
+    AES in counter mode with random access.
+
+    The keystream block for byte position p is E_K(icb + p // 16), so any
+    byte range of a message can be encrypted or decrypted on its own:
+    `crypt(data, offset)` processes data that sits at `offset` in the stream.
+    Without an offset, calls continue from the current position (`seek` / `tell`).
+    Once `prefetcher()` has taken over the counter space, only calls with an
+    explicit offset (decryption of its output) are allowed.
+    """
+
+    def __init__(self, key: bytes, nonce: bytes, counter_bits: int = 64, backend: str = "auto") -> None:
+        """
+        Args:
+            key (bytes): AES key (16, 24 or 32 bytes).
+            nonce (bytes): Either the full 16-byte initial counter block, or the
+                16 - counter_bits / 8 byte prefix (the counter then starts at 0).
+            counter_bits (int): Width of the big-endian counter in the low bits
+                of the block: 32, 64 or 128. It wraps modulo 2^counter_bits.
+            backend (str): Block-cipher backend name (see `src_py.aes.get_backend`).
+        """
+        if counter_bits not in COUNTER_BITS:
+            raise ValueError(f"Counter width must be one of {COUNTER_BITS} bits")
+        prefix_len = 16 - counter_bits // 8
+        if len(nonce) == prefix_len:
+            nonce = bytes(nonce) + b'\x00' * (16 - prefix_len)
+        elif len(nonce) != 16:
+            raise ValueError(f"Nonce must be {prefix_len} or 16 bytes")
+
+        self.icb = bytes(nonce)
+        self.counter_bits = counter_bits
+        self.aes = cached_backend(key, backend)
+        self._position = 0
+        self._prefetching = False
+
+    def seek(self, offset: int) -> None:
+        """Move the stream position to byte `offset`."""
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        self._position = offset
+
+    def tell(self) -> int:
+        """Return the current stream position in bytes."""
+        return self._position
+
+    def keystream(self, offset: int, length: int) -> bytes:
+        """Return keystream bytes [offset, offset + length)."""
+        return ctr_keystream(self.aes, self.icb, offset, length, self.counter_bits)
+
+    def crypt_into(self, data, out, offset: int = None) -> int:
+        """
+        XOR `data` with the keystream at `offset` into a caller-provided buffer (may alias `data`).
+        Returns:
+            int: Number of bytes written.
+        """
+        source = as_bytes_view(data)
+        dest = writable_view(out, len(source))
+        if offset is None:
+            if self._prefetching:
+                raise ValueError("Counter space belongs to the prefetcher; pass an explicit offset")
+            offset = self._position
+        ctr_xor_into(self.aes, self.icb, source, dest, offset, self.counter_bits)
+        self._position = offset + len(source)
+        return len(source)
+
+    def crypt(self, data, offset: int = None) -> bytes:
+        """
+        Encrypt or decrypt `data` located at byte `offset` of the stream
+        (default: the current position), and advance the position past it.
+        """
+        out = bytearray(len(as_bytes_view(data)))
+        self.crypt_into(data, out, offset)
+        return bytes(out)
+
+    def prefetcher(self, **kwargs):
+        """
+        Start a `KeystreamPrefetcher` over this key and counter sequence from the current position.
+        Keyword arguments (depth, watermarks, refill policy) are passed through.
+
+        The prefetcher owns every counter from here on: later `crypt` calls
+        without an explicit offset and a second `prefetcher()` raise, so the
+        same keystream is never used for two plaintexts.
+        """
+        if self._prefetching:
+            raise ValueError("Counter space already handed to a prefetcher")
+        self._prefetching = True
+        from src_py.aes_ops.ctr_prefetch import KeystreamPrefetcher
+        return KeystreamPrefetcher(self.aes, self.icb, self.counter_bits, offset=self._position, **kwargs)
+
+    # CTR is symmetric
+    encrypt = crypt
+    decrypt = crypt
+
+
+def encrypt_ctr(plaintext: bytes, key: bytes, nonce: bytes, counter_bits: int = 64, backend: str = "auto") -> bytes:
+    return AES_CTR(key, nonce, counter_bits, backend).crypt(plaintext, 0)
+
+
+def decrypt_ctr(ciphertext: bytes, key: bytes, nonce: bytes, counter_bits: int = 64, backend: str = "auto",
+                offset: int = 0) -> bytes:
+    return AES_CTR(key, nonce, counter_bits, backend).crypt(ciphertext, offset)
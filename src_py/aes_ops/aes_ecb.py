@@ -1,34 +1,75 @@
-from src_py.aes_ops.helper import xor_bytes, pkcs7_pad, pkcs7_unpad
+from src_py.aes_ops.buffer_ops import as_bytes_view, writable_view, xor_bytes, xor_into
+from src_py.aes_ops.helper import pkcs7_last_block, pkcs7_unpad
+from src_py.aes_ops.key_cache import cached_backend
 
 
 def encrypt_ecb(key, plaintext):
    block_size = len(key)
-   padded_plaintext = pkcs7_pad(plaintext, block_size)
-   num_blocks = len(padded_plaintext) // block_size
+   full_len, last_block = pkcs7_last_block(plaintext, block_size)
+   num_blocks = full_len // block_size + 1
 
-   cipher_text = b''
-   for i in range(num_blocks):
-      block_start = i * block_size
-      block_end = block_start + block_size
-      block = padded_plaintext[block_start:block_end]
+   # Preallocated output, only the last block is padded
+   cipher_text = bytearray(full_len + block_size)
+   out = memoryview(cipher_text)
+   out[:full_len] = memoryview(plaintext)[:full_len]
+   out[full_len:] = last_block
 
-      encrypted_block = xor_bytes(block, key)
-      cipher_text += encrypted_block
-
-   return cipher_text
+   # Every block is XORed with the key: one whole-buffer XOR against the repeated key
+   xor_into(out, key * num_blocks)
+   return bytes(cipher_text)
 
 
 def decrypt_ecb(key, ciphertext):
    block_size = len(key)
    num_blocks = len(ciphertext) // block_size
 
-   plain_text = b''
-   for i in range(num_blocks):
-      block_start = i * block_size
-      block_end = block_start + block_size
-      block = ciphertext[block_start:block_end]
-
-      decrypted_block = xor_bytes(block, key)
-      plain_text += decrypted_block
+   plain_text = xor_bytes(ciphertext[:num_blocks * block_size], key * num_blocks)
 
    return pkcs7_unpad(plain_text)
+
+
+def encrypt_ecb_into(key, plaintext, out):
+   """Encrypt into the writable buffer `out` (may alias plaintext); returns the bytes written."""
+   block_size = len(key)
+   source = as_bytes_view(plaintext)
+   full_len, last_block = pkcs7_last_block(source, block_size)
+   num_blocks = full_len // block_size + 1
+   dest = writable_view(out, full_len + block_size)
+
+   dest[:full_len] = source[:full_len]
+   dest[full_len:] = last_block
+   xor_into(dest, key * num_blocks)
+   return full_len + block_size
+
+
+def decrypt_ecb_into(key, ciphertext, out):
+   """Decrypt into the writable buffer `out` (may alias ciphertext); returns the unpadded length."""
+   block_size = len(key)
+   source = as_bytes_view(ciphertext)
+   n = len(source) // block_size * block_size
+   dest = writable_view(out, n)
+
+   dest[:] = source[:n]
+   xor_into(dest, key * (n // block_size))
+   return n - block_size + len(pkcs7_unpad(bytes(dest[n - block_size:])))
+
+
+def encrypt_ecb_aes(key, plaintext, backend="auto"):
+   """
+   AES-ECB encryption with PKCS#7 padding (the functions above only XOR with the key).
+   Every block is independent, so the whole padded buffer goes through one multi-block call.
+   """
+   aes = cached_backend(key, backend)
+   full_len, last_block = pkcs7_last_block(plaintext, 16)
+   padded = bytearray(full_len + 16)
+   padded[:full_len] = memoryview(plaintext)[:full_len]
+   padded[full_len:] = last_block
+   return bytes(aes.encrypt_blocks(bytes(padded)))
+
+
+def decrypt_ecb_aes(key, ciphertext, backend="auto"):
+   """AES-ECB decryption and PKCS#7 unpadding, one multi-block call."""
+   if len(ciphertext) == 0 or len(ciphertext) % 16 != 0:
+      raise ValueError("Ciphertext length must be multiple of block size")
+   aes = cached_backend(key, backend)
+   return pkcs7_unpad(bytes(aes.decrypt_blocks(bytes(ciphertext))))
@@ -0,0 +1,62 @@
+from src_py.aes import get_backend
+from src_py.aes_ops.aes_ecb import encrypt_ecb_aes, decrypt_ecb_aes
+from src_py.aes_ops.helper import pkcs7_last_block, pkcs7_unpad
+from src_py.aes_ops.process_pool import (
+    attach, map_chunks, pool_settings, shared_buffers, start_pool, use_serial, worker_context,
+)
+
+
+def _ecb_chunk(start: int, end: int, name: str, inverse: bool) -> None:
+    """Worker task: encrypt or decrypt blocks [start:end) of the shared buffer in place."""
+    aes = worker_context()
+    with attach(name) as (shm,):
+        block = bytes(shm.buf[start:end])
+        shm.buf[start:end] = aes.decrypt_blocks(block) if inverse else aes.encrypt_blocks(block)
+
+
+def _ecb_parallel(data: bytes, key: bytes, inverse: bool, workers: int, backend: str, chunk_size: int) -> bytes:
+    """Run the multi-block engine over block-aligned ranges of `data` across a process pool."""
+    n = len(data)
+    with shared_buffers(n) as (shm,):
+        shm.buf[:n] = data
+        with start_pool(workers, get_backend, backend, bytes(key)) as pool:
+            map_chunks(pool, _ecb_chunk, n, workers, chunk_size, shm.name, inverse)
+        return bytes(shm.buf[:n])
+
+
+def encrypt_ecb_parallel(key: bytes, plaintext: bytes, workers: int = None,
+                         backend: str = "auto", chunk_size: int = 1 << 20) -> bytes:
+    """
+    AES-ECB encryption partitioned across a process pool.
+
+    Blocks are independent, so each worker encrypts a block-aligned range of
+    the padded plaintext in shared memory. Output equals `encrypt_ecb_aes`.
+
+    Args:
+        key (bytes): AES key.
+        plaintext (bytes): Data to encrypt (PKCS#7 padded here).
+        workers (int): Number of worker processes (default: os.cpu_count()).
+        backend (str): Block-cipher backend name used by the workers.
+        chunk_size (int): Upper bound in bytes of one worker task.
+    """
+    workers, chunk_size = pool_settings(workers, chunk_size)
+    if use_serial(len(plaintext), workers, chunk_size):
+        return encrypt_ecb_aes(key, plaintext, backend)
+
+    full_len, last_block = pkcs7_last_block(plaintext, 16)
+    padded = bytearray(full_len + 16)
+    padded[:full_len] = memoryview(plaintext)[:full_len]
+    padded[full_len:] = last_block
+    return _ecb_parallel(padded, key, False, workers, backend, chunk_size)
+
+
+def decrypt_ecb_parallel(key: bytes, ciphertext: bytes, workers: int = None,
+                         backend: str = "auto", chunk_size: int = 1 << 20) -> bytes:
+    """AES-ECB decryption across a process pool; output equals `decrypt_ecb_aes`."""
+    workers, chunk_size = pool_settings(workers, chunk_size)
+    if use_serial(len(ciphertext), workers, chunk_size):
+        return decrypt_ecb_aes(key, ciphertext, backend)
+
+    if len(ciphertext) % 16 != 0:
+        raise ValueError("Ciphertext length must be multiple of block size")
+    return pkcs7_unpad(_ecb_parallel(ciphertext, key, True, workers, backend, chunk_size))
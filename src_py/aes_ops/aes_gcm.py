@@ -1,5 +1,12 @@
-from src_py.aes import AES
-from src_py.aes_ops.helper import xor_bytes
+import copy
+import hmac
+
+from src_py.aes_ops.buffer_ops import as_bytes_view, writable_view, xor_bytes, xor_into
+from src_py.aes_ops.aes_ctr import ctr_xor_into
+from src_py.aes_ops.helper import counter_blocks
+from src_py.aes_ops.key_cache import cached_gcm_key
+from src_py.aes_ops.ghash import GHashBatch
+from src_py.aes_ops.aes_gcm_stream import GCMEncryptor, GCMDecryptor
 
 class AES_GCM(object):
     """
@@ -15,7 +22,11 @@ class AES_GCM(object):
       - Authentication: GHASH over AAD (A), ciphertext (C), and their lengths, keyed by H = E_K(0^128).
     """
 
-    def __init__(self, key: bytes, IV: bytes, A: bytes, tag_len: int = 16) -> None:
+    # Counter blocks encrypted per multi-block call in GCTR
+    GCTR_CHUNK_BLOCKS = 4096
+
+    def __init__(self, key: bytes, IV: bytes, A: bytes, tag_len: int = 16, backend: str = "auto",
+                 ghash_window: int = 8, ghash_aggregate: int = 4) -> None:
         """
         Initialize the AES-GCM context.
 
@@ -31,20 +42,33 @@ class AES_GCM(object):
         tag_len : int, optional
             Length of the authentication tag in bytes. Commonly 16 (full 128-bit tag),
             but can be shorter (e.g., 12, 8) depending on security requirements.
+        backend : str, optional
+            Name of the block-cipher backend (see `src_py.aes.get_backend`).
+            "auto" picks the fastest available one, "reference" the byte-level AES.
+        ghash_window : int, optional
+            Digit size in bits (4 or 8) of the per-key GHASH multiplication
+            tables. 8 is faster, 4 uses 16x less table memory.
+        ghash_aggregate : int, optional
+            Number of blocks k folded per GHASH step, using precomputed
+            powers H, H^2, ..., H^k. 1 gives the plain sequential GHASH.
 
         Notes
         -----
         - The AES engine is assumed to perform raw ECB encryption on 16-byte blocks.
         - The hash subkey H is computed as H = AES_K(0^128) and is used by GHASH.
+        - Multiplication tables for H, ..., H^k are built once per key and kept in
+          `key_cache.default_key_cache`, so later contexts with the same key skip
+          the setup; `mul` stays as the bit-serial reference implementation.
         """
         self._key = key
         self._IV = IV
         self._A = A  # AAD
         self._tag_len = tag_len
-        self.aes = AES(key)
-
-        # Hash subkey H = E_K(0^128)
-        self.H = self._aes_encrypt(b'\x00' * 16)
+        self._backend = backend
+        self._ghash_window = ghash_window
+        self._ghash_aggregate = ghash_aggregate
+        # Block cipher, hash subkey H = E_K(0^128) and its GHASH tables
+        self.aes, self.H, self._ghash = cached_gcm_key(key, backend, ghash_window, ghash_aggregate)
 
     def _aes_encrypt(self, block: bytes) -> bytes:
         return self.aes.encrypt(block)
@@ -121,7 +145,12 @@ class AES_GCM(object):
         -----
         The input length must be a multiple of 16. If not, padding must be handled
         before calling this function.
+        When H is this context's hash subkey, the precomputed tables are used;
+        any other H falls back to the bit-serial `mul`.
         """
+        if H == self.H:
+            return self._ghash.ghash(x)
+
         y = b'\x00' * 16
         num_blocks = len(x) // 16
 
@@ -156,21 +185,35 @@ class AES_GCM(object):
         GCTR is symmetric: applying it twice with the same icb and key yields the
         original input.
         """
-        if not x:
-            return b''
+        out = bytearray(len(x))
+        self.GCTR_into(icb, x, out)
+        return bytes(out)
 
-        n = (len(x) + 15) // 16
-        cb = icb
-        out = b''
+    def GCTR_into(self, icb: bytes, x, out) -> int:
+        """
+        GCTR writing into a caller-provided buffer.
 
-        for i in range(n):
-            chunk = x[i * 16: (i + 1) * 16]
-            keystream = self._aes_encrypt(cb)
-            y = xor_bytes(chunk, keystream[:len(chunk)])
-            out += y
-            cb = self.incre_func(cb)
+        Parameters
+        ----------
+        icb : bytes
+            Initial counter block (16 bytes).
+        x : bytes-like
+            Input data; any buffer-protocol object.
+        out : writable buffer
+            Receives len(x) bytes. May be the input buffer itself (in-place).
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
+        source = as_bytes_view(x)
+        size = len(source)
+        view = writable_view(out, size)
 
-        return out
+        # GCTR is CTR with a 32-bit counter (inc_32)
+        ctr_xor_into(self.aes, icb, source, view, 0, 32, self.GCTR_CHUNK_BLOCKS)
+        return size
 
     def _compute_J0(self) -> bytes:
         """
@@ -225,28 +268,23 @@ class AES_GCM(object):
         Notes
         -----
         The tag is computed as:
-          1. Construct X = A || pad(A) || C || pad(C) || len(A)_64 || len(C)_64
-          2. S = GHASH_H(X)
+          1. X = A || pad(A) || C || pad(C) || len(A)_64 || len(C)_64
+          2. S = GHASH_H(X), folded part by part without building X
           3. Tag_full = GCTR(J0, S) = AES_K(J0) XOR S
           4. Tag = leftmost tag_len bytes of Tag_full
         """
-        u = (16 - (len(cipher) % 16)) % 16
-        v = (16 - (len(self._A) % 16)) % 16
-
-        len_A_bits = len(self._A) * 8
-        len_C_bits = len(cipher) * 8
-
-        len_A_bits_bytes = len_A_bits.to_bytes(8, 'big')
-        len_C_bits_bytes = len_C_bits.to_bytes(8, 'big')
+        # A, C and the lengths block are folded into GHASH one after another,
+        # so X is never materialized as one more copy of the ciphertext
+        y = self._ghash.update_padded(0, self._A)
+        y = self._ghash.update_padded(y, cipher)
+        return self._tag_from_ghash(y, len(cipher), J0)
+
+    def _tag_from_ghash(self, y: int, cipher_len: int, J0: bytes) -> bytes:
+        """Tag from the GHASH state over A || pad(A) || C || pad(C): fold the lengths block, then E_K(J0) XOR S."""
+        len_A_bits_bytes = (len(self._A) * 8).to_bytes(8, 'big')
+        len_C_bits_bytes = (cipher_len * 8).to_bytes(8, 'big')
+        S = self._ghash.update(y, len_A_bits_bytes + len_C_bits_bytes).to_bytes(16, 'big')
 
-        A_gen = (
-            self._A + b'\x00' * v +
-            cipher + b'\x00' * u +
-            len_A_bits_bytes +
-            len_C_bits_bytes
-        )
-
-        S = self.ghash_func(A_gen, self.H)
         tag_block = self.GCTR(J0, S)  # E_K(J0) XOR S via GCTR
         return tag_block[:self._tag_len]
 
@@ -305,28 +343,211 @@ class AES_GCM(object):
         Raises
         ------
         ValueError
-            If the computed authentication tag does not match the provided tag,
-            indicating tampering, incorrect key, or incorrect IV/AAD.
+            If the provided tag is not `tag_len` bytes long or does not match the
+            computed tag, indicating tampering, incorrect key, or incorrect IV/AAD.
 
         Notes
         -----
-        Steps:
-          1. Recompute J0 from the IV.
-          2. Compute expected_tag = _calc_auth_tag(C, J0).
-          3. Compare expected_tag with the provided tag.
-             - If mismatch: raise ValueError.
-             - If equal: proceed.
-          4. Decrypt: P = GCTR(J1, C) with J1 = J0 + 1.
+        Single pass (`_decrypt_staged`): each chunk of C is folded into GHASH
+        and decrypted with P = GCTR(J1, C) while it is still in cache. The
+        plaintext goes to a staging buffer that is only returned after
+        the tag check (`_tag_matches`: full `tag_len` bytes, hmac.compare_digest)
+        passes; on mismatch it is wiped and ValueError is raised.
         """
+        return bytes(self._decrypt_staged(as_bytes_view(ciphertext), tag))
+
+    def _tag_matches(self, expected: bytes, tag: bytes) -> bool:
+        """Constant-time check of a received tag; it must be exactly `tag_len` bytes."""
+        return len(tag) == self._tag_len and hmac.compare_digest(expected, tag)
+
+    def _decrypt_staged(self, source, tag: bytes) -> bytearray:
+        """
+        Fused GHASH + GCTR over `source` into a private staging buffer.
+
+        Returns
+        -------
+        bytearray
+            The plaintext, only after the tag has been verified.
+
+        Raises
+        ------
+        ValueError
+            If `tag` is not `tag_len` bytes or does not match the computed tag.
+        """
+        size = len(source)
+        staging = bytearray(size)
+        view = memoryview(staging)
         J0 = self._compute_J0()
-        expected_tag = self._calc_auth_tag(ciphertext, J0)[:len(tag)]
+        J1 = self.incre_func(J0)
+
+        y = self._ghash.update_padded(0, self._A)
+        chunk = self.GCTR_CHUNK_BLOCKS * 16
+        for start in range(0, size, chunk):
+            piece = source[start:start + chunk]
+            y = self._ghash.update_padded(y, piece)
+            ctr_xor_into(self.aes, J1, piece, view[start:start + len(piece)], start, 32, self.GCTR_CHUNK_BLOCKS)
 
-        if expected_tag != tag:
+        if not self._tag_matches(self._tag_from_ghash(y, size, J0), tag):
+            view[:] = bytes(size)
             raise ValueError("GCM authentication failed: tag mismatch")
+        return staging
 
-        J1 = self.incre_func(J0)
-        decrypted = self.GCTR(J1, ciphertext)
-        return decrypted
+    def encrypt_gcm_into(self, plaintext, out) -> bytes:
+        """
+        Encrypt into a caller-provided buffer and return the tag.
+
+        Parameters
+        ----------
+        plaintext : bytes-like
+            Any buffer-protocol object.
+        out : writable buffer
+            Receives len(plaintext) ciphertext bytes; may alias `plaintext`.
+
+        Returns
+        -------
+        bytes
+            Authentication tag of length `self._tag_len` bytes.
+        """
+        J0 = self._compute_J0()
+        written = self.GCTR_into(self.incre_func(J0), plaintext, out)
+        return self._calc_auth_tag(as_bytes_view(out)[:written], J0)
+
+    def decrypt_gcm_into(self, ciphertext, tag: bytes, out) -> int:
+        """
+        Decrypt and verify in one pass, then copy into a caller-provided buffer.
+
+        Parameters
+        ----------
+        ciphertext : bytes-like
+            Any buffer-protocol object.
+        tag : bytes
+            Authentication tag received along with the ciphertext.
+        out : writable buffer
+            Receives len(ciphertext) plaintext bytes; may alias `ciphertext`.
+            Left untouched when authentication fails.
+
+        Returns
+        -------
+        int
+            Number of plaintext bytes written.
+
+        Raises
+        ------
+        ValueError
+            If the computed authentication tag does not match the provided tag.
+        """
+        source = as_bytes_view(ciphertext)
+        dest = writable_view(out, len(source))
+        dest[:] = self._decrypt_staged(source, tag)
+        return len(source)
+
+    def reseal_gcm(self, ciphertext: bytes, tag: bytes, edits, allow_nonce_reuse: bool = False):
+        """
+        Apply in-place plaintext edits to a sealed message without re-processing all of it.
+
+        Parameters
+        ----------
+        ciphertext : bytes
+            Previous ciphertext sealed with this context's key, IV and AAD.
+        tag : bytes
+            Its authentication tag (`tag_len` bytes).
+        edits : iterable of (int, bytes)
+            (byte offset, new plaintext) pairs; each must lie inside the
+            message, which keeps its length. Later edits win on overlap.
+        allow_nonce_reuse : bool
+            Must be True: the edited message is sealed under the same IV.
+
+        Returns
+        -------
+        tuple[bytes, bytes]
+            (ciphertext, tag), identical to `encrypt_gcm` on the edited plaintext.
+
+        Notes
+        -----
+        Only the counter blocks covering an edit are re-encrypted. GHASH is
+        linear, so for C block b (0-based, n blocks) changing by D_b the tag
+        changes by D_b * H^(n + 1 - b): each edited range is hashed on its own
+        and shifted with one power of H. Cost is O(edited bytes + log n).
+
+        This reuses the IV, which breaks GCM once both versions are seen.
+        Besides the XOR of the old and new plaintext, T XOR T' is a known
+        polynomial in H (sum of D_b * H^(n + 1 - b)); its roots give the
+        GHASH key, and with it tags can be forged for any message under this
+        key (the "forbidden attack"). Only use it when the previous
+        (ciphertext, tag) can never be observed alongside the new one.
+
+        Raises
+        ------
+        ValueError
+            If `allow_nonce_reuse` is not True, or an edit lies outside the message.
+        """
+        if allow_nonce_reuse is not True:
+            raise ValueError("reseal_gcm reuses the IV; pass allow_nonce_reuse=True to accept the risk")
+        out = bytearray(ciphertext)
+        view = memoryview(out)
+        size = len(out)
+        num_blocks = (size + 15) // 16
+        J1 = self.incre_func(self._compute_J0())
+
+        delta = 0
+        for offset, data in edits:
+            data = as_bytes_view(data)
+            if offset < 0 or offset + len(data) > size:
+                raise ValueError("Edit range must lie inside the message")
+            if not len(data):
+                continue
+
+            first = offset // 16
+            last = (offset + len(data) + 15) // 16
+            old = bytes(view[first * 16:last * 16])
+            ctr_xor_into(self.aes, J1, data, view[offset:offset + len(data)], offset, 32)
+            diff = xor_bytes(old, view[first * 16:last * 16])
+
+            # GHASH of the changed blocks alone, shifted to their position in X
+            y = self._ghash.update_padded(0, diff)
+            delta ^= self._ghash.combine(y, 0, num_blocks - last + 1)
+
+        new_tag = xor_bytes(tag, delta.to_bytes(16, 'big'))
+        return bytes(out), new_tag
+
+    def with_nonce(self, IV: bytes, A: bytes) -> "AES_GCM":
+        """
+        Return a context for another message under the same key.
+
+        The copy shares the block cipher, H and the GHASH tables with this
+        context, so no key setup is repeated; only IV and AAD differ.
+        """
+        if not IV:
+            raise ValueError("GCM IV must not be empty")
+        gcm = copy.copy(self)
+        gcm._IV = bytes(IV)
+        gcm._A = bytes(A)
+        return gcm
+
+    def encryptor(self) -> GCMEncryptor:
+        """
+        Start a streaming encryption with this context's key, IV and AAD.
+
+        Returns
+        -------
+        GCMEncryptor
+            Object with `update_aad(data)`, `update(data) -> bytes` and
+            `finalize() -> tag`; memory use does not grow with the message.
+        """
+        return GCMEncryptor(self)
+
+    def decryptor(self) -> GCMDecryptor:
+        """
+        Start a streaming decryption with this context's key, IV and AAD.
+
+        Returns
+        -------
+        GCMDecryptor
+            Object with `update_aad(data)`, `update(data) -> bytes` and
+            `verify(tag)`. Plaintext from `update` must not be trusted until
+            `verify` has returned.
+        """
+        return GCMDecryptor(self)
 
     @staticmethod
     def incre_func(X: bytes) -> bytes:
@@ -358,4 +579,234 @@ class AES_GCM(object):
         counter_part = (counter_part + 1) & 0xFFFFFFFF
 
         # return iv_part + struct.pack('>I', counter_part)
-        return iv_part + counter_part.to_bytes(4, 'big')
\ No newline at end of file
+        return iv_part + counter_part.to_bytes(4, 'big')
+
+    @staticmethod
+    def add_counter(X: bytes, n: int) -> bytes:
+        """
+        Advance the least significant 32 bits of a 16-byte counter block by n.
+
+        Parameters
+        ----------
+        X : bytes
+            16-byte counter block (96-bit prefix || 32-bit counter).
+        n : int
+            Number of increments to apply.
+
+        Returns
+        -------
+        bytes
+            The counter block after n applications of `incre_func`
+            (modulo 2^32 on the counter part).
+        """
+        counter_part = (int.from_bytes(X[-4:], 'big') + n) & 0xFFFFFFFF
+        return X[:-4] + counter_part.to_bytes(4, 'big')
+
+
+class AES_GCM_Key(object):
+    """
+    Key-scoped AES-GCM context.
+
+    Key schedule, hash subkey H and GHASH tables are computed once in the
+    constructor; `seal` and `open` then take the nonce and AAD per message.
+    All per-message state lives in a short-lived `AES_GCM` copy, so one
+    instance can be shared between threads.
+    """
+
+    def __init__(self, key: bytes, tag_len: int = 16, backend: str = "auto",
+                 ghash_window: int = 8, ghash_aggregate: int = 4) -> None:
+        """
+        Parameters
+        ----------
+        key, tag_len, backend, ghash_window, ghash_aggregate
+            Same as `AES_GCM`.
+        """
+        self._gcm = AES_GCM(key, b'\x00' * 12, b'', tag_len, backend, ghash_window, ghash_aggregate)
+        self._ghash_batch = None
+
+    def seal(self, nonce: bytes, aad: bytes, plaintext: bytes):
+        """
+        Encrypt and authenticate one message.
+
+        Returns
+        -------
+        tuple[bytes, bytes]
+            (ciphertext, tag), identical to `AES_GCM(key, nonce, aad).encrypt_gcm(plaintext)`.
+        """
+        return self._gcm.with_nonce(nonce, aad).encrypt_gcm(plaintext)
+
+    def open(self, nonce: bytes, aad: bytes, ciphertext: bytes, tag: bytes) -> bytes:
+        """
+        Verify and decrypt one message.
+
+        Raises
+        ------
+        ValueError
+            If the computed authentication tag does not match the provided tag.
+        """
+        return self._gcm.with_nonce(nonce, aad).decrypt_gcm(ciphertext, tag)
+
+    def _J0s(self, nonces) -> list:
+        """J0 for every nonce; 96-bit nonces skip the GHASH."""
+        J0s = []
+        for nonce in nonces:
+            if not nonce:
+                raise ValueError("GCM IV must not be empty")
+            J0s.append(bytes(nonce) + b'\x00\x00\x00\x01' if len(nonce) == 12
+                       else self._gcm.with_nonce(nonce, b'')._compute_J0())
+        return J0s
+
+    def _tags(self, records, masks) -> list:
+        """Tags from (nonce, aad, ciphertext) records and their E_K(J0) blocks, GHASH batched across records."""
+        if self._ghash_batch is None:
+            self._ghash_batch = GHashBatch(self._gcm.H)
+
+        inputs = [
+            bytes(aad) + b'\x00' * (-len(aad) % 16) +
+            bytes(ciphertext) + b'\x00' * (-len(ciphertext) % 16) +
+            (len(aad) * 8).to_bytes(8, 'big') + (len(ciphertext) * 8).to_bytes(8, 'big')
+            for _, aad, ciphertext in records
+        ]
+        S = self._ghash_batch.ghash_many(inputs)
+        return [xor_bytes(mask, s)[:self._gcm._tag_len] for mask, s in zip(masks, S)]
+
+    def _keystreams(self, J0s, lengths) -> tuple:
+        """
+        E_K(J0) of every record and the GCTR keystream for every record
+        length, all from one multi-block call.
+
+        Returns
+        -------
+        tuple[list[bytes], bytes, list[int]]
+            (E_K(J0) per record, concatenated keystream, byte offset of each
+            record's keystream, each record starting on a block boundary).
+        """
+        counters = [b''.join(J0s)]
+        offsets = []
+        position = 0
+        for J0, length in zip(J0s, lengths):
+            blocks = (length + 15) // 16
+            counters.append(counter_blocks(self._gcm.incre_func(J0), blocks))
+            offsets.append(position)
+            position += blocks * 16
+        out = bytes(self._gcm.aes.encrypt_blocks(b''.join(counters))) if J0s else b''
+        head = 16 * len(J0s)
+        masks = [out[i:i + 16] for i in range(0, head, 16)]
+        return masks, out[head:], offsets
+
+    def _gctr_many(self, keystream: bytes, offsets, payloads) -> list:
+        """XOR every payload with its slice of the packed keystream in one bulk XOR."""
+        packed = bytearray(len(keystream))
+        for offset, payload in zip(offsets, payloads):
+            packed[offset:offset + len(payload)] = payload
+        xor_into(packed, keystream)
+        return [bytes(packed[offset:offset + len(payload)]) for offset, payload in zip(offsets, payloads)]
+
+    def compute_tags(self, records) -> list:
+        """
+        Tags of many messages at once, with the semantics of `AES_GCM._calc_auth_tag`.
+
+        The GHASH inputs A || pad(A) || C || pad(C) || len(A)_64 || len(C)_64
+        of all records run through `GHashBatch` (one NumPy lane per message)
+        and E_K(J0) of all nonces comes from one multi-block call.
+
+        Parameters
+        ----------
+        records : list of (bytes, bytes, bytes)
+            (nonce, aad, ciphertext) per message.
+
+        Returns
+        -------
+        list[bytes]
+            Tags of length `tag_len`, in input order.
+        """
+        records = list(records)
+        J0s = b''.join(self._J0s([nonce for nonce, _, _ in records]))
+        masks = bytes(self._gcm.aes.encrypt_blocks(J0s)) if J0s else b''
+        return self._tags(records, [masks[i:i + 16] for i in range(0, len(masks), 16)])
+
+    def seal_many(self, records) -> list:
+        """
+        Encrypt and authenticate many messages under this key.
+
+        Every counter block of every record (and every E_K(J0)) goes through
+        one multi-block cipher call, the keystream is applied with one bulk
+        XOR, and the tags come from the batched GHASH.
+
+        Parameters
+        ----------
+        records : list of (bytes, bytes, bytes)
+            (nonce, aad, plaintext) per message.
+
+        Returns
+        -------
+        list[tuple[bytes, bytes]]
+            (ciphertext, tag) per record, in input order; each equals `seal`.
+        """
+        records = list(records)
+        plaintexts = [bytes(pt) for _, _, pt in records]
+        masks, keystream, offsets = self._keystreams(self._J0s([nonce for nonce, _, _ in records]),
+                                                     [len(pt) for pt in plaintexts])
+        ciphertexts = self._gctr_many(keystream, offsets, plaintexts)
+        tags = self._tags([(nonce, aad, ct) for (nonce, aad, _), ct in zip(records, ciphertexts)], masks)
+        return list(zip(ciphertexts, tags))
+
+    def open_many(self, records) -> list:
+        """
+        Verify and decrypt many messages under this key, failing per record.
+
+        Parameters
+        ----------
+        records : list of (bytes, bytes, bytes, bytes)
+            (nonce, aad, ciphertext, tag) per message.
+
+        Returns
+        -------
+        list[tuple[bytes, str]]
+            (plaintext, None) for records whose tag verifies and
+            (None, reason) for the others, in input order. Tags must be
+            exactly `tag_len` bytes. A tag mismatch
+            does not abort the batch, and plaintext of a failed record is
+            never returned.
+        """
+        records = list(records)
+        ciphertexts = [bytes(ct) for _, _, ct, _ in records]
+        masks, keystream, offsets = self._keystreams(self._J0s([nonce for nonce, _, _, _ in records]),
+                                                     [len(ct) for ct in ciphertexts])
+        expected = self._tags([(nonce, aad, ct) for (nonce, aad, _, _), ct in zip(records, ciphertexts)], masks)
+        plaintexts = self._gctr_many(keystream, offsets, ciphertexts)
+
+        results = []
+        for (_, _, _, tag), tag_expected, plaintext in zip(records, expected, plaintexts):
+            if self._gcm._tag_matches(tag_expected, tag):
+                results.append((plaintext, None))
+            else:
+                results.append((None, "GCM authentication failed: tag mismatch"))
+        return results
+
+    def verify_many(self, records) -> list:
+        """
+        Bulk tag verification.
+
+        Parameters
+        ----------
+        records : list of (bytes, bytes, bytes, bytes)
+            (nonce, aad, ciphertext, tag) per message.
+
+        Returns
+        -------
+        list[bool]
+            True where the tag is `tag_len` bytes long and matches, in input order.
+        """
+        tags = self.compute_tags([(nonce, aad, ct) for nonce, aad, ct, _ in records])
+        return [self._gcm._tag_matches(expected, tag) for expected, (_, _, _, tag) in zip(tags, records)]
+
+
+def seal_many(key: bytes, records, tag_len: int = 16, backend: str = "auto") -> list:
+    """Bulk AES-GCM: (nonce, aad, plaintext) records under one key -> [(ciphertext, tag), ...]."""
+    return AES_GCM_Key(key, tag_len, backend).seal_many(records)
+
+
+def open_many(key: bytes, records, tag_len: int = 16, backend: str = "auto") -> list:
+    """Bulk AES-GCM: (nonce, aad, ciphertext, tag) records -> [(plaintext or None, error or None), ...]."""
+    return AES_GCM_Key(key, tag_len, backend).open_many(records)
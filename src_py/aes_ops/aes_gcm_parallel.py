@@ -0,0 +1,140 @@
+from src_py.aes_ops.aes_gcm import AES_GCM
+from src_py.aes_ops.process_pool import (
+    attach, map_chunks, pool_settings, shared_buffers, start_pool, use_serial, worker_context,
+)
+
+
+def _gctr_ghash_chunk(start: int, end: int, in_name: str, out_name: str, J1: bytes, hash_output: bool):
+    """
+    Worker task: GCTR over payload[start:end] and partial GHASH of the ciphertext side.
+
+    Returns
+    -------
+    tuple[int, int]
+        (GHASH of the zero-padded ciphertext chunk started from 0, number of blocks).
+    """
+    gcm = worker_context()
+    with attach(in_name, out_name) as (shm_in, shm_out):
+        chunk = bytes(shm_in.buf[start:end])
+        out = gcm.GCTR(gcm.add_counter(J1, start // 16), chunk)
+        shm_out.buf[start:end] = out
+
+    hashed = out if hash_output else chunk
+    return gcm._ghash.update_padded(0, hashed), -(-len(hashed) // 16)
+
+
+class AES_GCM_Parallel(AES_GCM):
+    """
+    AES-GCM whose GCTR and GHASH run across a process pool.
+
+    The payload is split into block-aligned counter ranges. Each worker
+    encrypts (or decrypts) its range with the counter advanced to the range
+    start and returns the GHASH of its ciphertext range; the partial hashes
+    are combined with powers of H. Input and output live in shared memory so
+    the payload is never pickled. Ciphertext and tag are byte-identical to
+    `AES_GCM`.
+    """
+
+    def __init__(self, key: bytes, IV: bytes, A: bytes, tag_len: int = 16, backend: str = "auto",
+                 ghash_window: int = 8, ghash_aggregate: int = 4,
+                 workers: int = None, chunk_size: int = 1 << 20) -> None:
+        """
+        Parameters
+        ----------
+        key, IV, A, tag_len, backend, ghash_window, ghash_aggregate
+            Same as `AES_GCM`.
+        workers : int, optional
+            Number of worker processes (default: os.cpu_count()). With 1 worker
+            the serial `AES_GCM` path is used.
+        chunk_size : int, optional
+            Upper bound in bytes of one worker task (rounded to whole blocks).
+            Payloads shorter than two chunks are processed serially.
+        """
+        super().__init__(key, IV, A, tag_len, backend, ghash_window, ghash_aggregate)
+        self._workers, self._chunk_size = pool_settings(workers, chunk_size)
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = start_pool(self._workers, AES_GCM, self._key, self._IV, self._A, self._tag_len,
+                                    self._backend, self._ghash_window, self._ghash_aggregate)
+        return self._pool
+
+    def _use_serial(self, n: int) -> bool:
+        return use_serial(n, self._workers, self._chunk_size)
+
+    def _parallel_pass(self, data: bytes, J1: bytes, hash_output: bool):
+        """
+        Run GCTR over `data` in parallel and GHASH the ciphertext side.
+
+        Returns
+        -------
+        tuple[bytes, int]
+            (GCTR output, GHASH state over the zero-padded ciphertext).
+        """
+        n = len(data)
+        with shared_buffers(n, 2) as (shm_in, shm_out):
+            shm_in.buf[:n] = data
+            partials = map_chunks(self._get_pool(), _gctr_ghash_chunk, n, self._workers, self._chunk_size,
+                                  shm_in.name, shm_out.name, J1, hash_output)
+            out = bytes(shm_out.buf[:n])
+
+        y = 0
+        for y_chunk, blocks in partials:
+            y = self._ghash.combine(y, y_chunk, blocks)
+        return out, y
+
+    def _finish_tag(self, y_cipher: int, cipher_len: int, J0: bytes) -> bytes:
+        """Tag from the GHASH state of the padded ciphertext: prepend A, then finish like `AES_GCM`."""
+        y = self._ghash.update_padded(0, self._A)
+        y = self._ghash.combine(y, y_cipher, -(-cipher_len // 16))
+        return self._tag_from_ghash(y, cipher_len, J0)
+
+    def encrypt_gcm(self, plaintext: bytes):
+        """
+        Encrypt with AES-GCM across the worker pool.
+
+        Returns
+        -------
+        tuple[bytes, bytes]
+            (ciphertext, tag), identical to `AES_GCM.encrypt_gcm`.
+        """
+        if self._use_serial(len(plaintext)):
+            return super().encrypt_gcm(plaintext)
+
+        J0 = self._compute_J0()
+        ciphertext, y = self._parallel_pass(plaintext, self.incre_func(J0), hash_output=True)
+        return ciphertext, self._finish_tag(y, len(ciphertext), J0)
+
+    def decrypt_gcm(self, ciphertext: bytes, tag: bytes) -> bytes:
+        """
+        Decrypt with AES-GCM across the worker pool and verify the tag.
+
+        Decryption and GHASH run in the same parallel pass; the plaintext is
+        only returned once the tag has been verified.
+
+        Raises
+        ------
+        ValueError
+            If the provided tag is not `tag_len` bytes long or does not match the computed tag.
+        """
+        if self._use_serial(len(ciphertext)):
+            return super().decrypt_gcm(ciphertext, tag)
+
+        J0 = self._compute_J0()
+        plaintext, y = self._parallel_pass(ciphertext, self.incre_func(J0), hash_output=False)
+        if not self._tag_matches(self._finish_tag(y, len(ciphertext), J0), tag):
+            raise ValueError("GCM authentication failed: tag mismatch")
+        return plaintext
@@ -0,0 +1,159 @@
+import abc
+import hmac
+
+from src_py.aes_ops.aes_ctr import ctr_keystream, ctr_xor_into
+from src_py.aes_ops.buffer_ops import as_bytes_view, writable_view, xor_bytes
+
+
+class _GHashStream:
+    """
+    Running GHASH over input of any length.
+
+    Keeps the GHASH state and at most 15 not yet folded bytes; `flush` zero-pads
+    the pending bytes, which ends one GHASH segment (AAD or ciphertext).
+    """
+
+    def __init__(self, ghash) -> None:
+        self._ghash = ghash
+        self.y = 0
+        self._pending = b''
+
+    def update(self, data) -> None:
+        view = as_bytes_view(data)
+        start = 0
+        if self._pending:
+            start = min(16 - len(self._pending), len(view))
+            self._pending += bytes(view[:start])
+            if len(self._pending) < 16:
+                return
+            self.y = self._ghash.update(self.y, self._pending)
+            self._pending = b''
+
+        full = start + (len(view) - start) // 16 * 16
+        self.y = self._ghash.update(self.y, view[start:full])
+        self._pending = bytes(view[full:])
+
+    def flush(self) -> None:
+        if self._pending:
+            self.y = self._ghash.update_padded(self.y, self._pending)
+            self._pending = b''
+
+
+class _GCMStream(abc.ABC):
+    """
+    Incremental AES-GCM over an `AES_GCM` context.
+
+    Holds only the GHASH state, the counter position and the unused bytes of
+    the last keystream block, so memory stays constant whatever the total
+    length. The context's `A` is authenticated first; `update_aad` appends
+    more AAD before the first `update`.
+    """
+
+    def __init__(self, gcm) -> None:
+        self._gcm = gcm
+        self._J0 = gcm._compute_J0()
+        self._J1 = gcm.incre_func(self._J0)
+        self._hash = _GHashStream(gcm._ghash)
+        self._hash.update(gcm._A)
+        self._aad_len = len(gcm._A)
+        self._msg_len = 0
+        self._counter = 0       # counter blocks consumed after J1
+        self._keystream = b''   # unused tail of the last keystream block
+        self._in_message = False
+        self._tag = None
+
+    def update_aad(self, data) -> None:
+        """Authenticate more additional data; only allowed before the first `update`."""
+        if self._in_message or self._tag is not None:
+            raise ValueError("AAD must be supplied before the message")
+        self._hash.update(data)
+        self._aad_len += len(as_bytes_view(data))
+
+    def _start_message(self) -> None:
+        if self._tag is not None:
+            raise ValueError("GCM stream already finalized")
+        if not self._in_message:
+            self._hash.flush()
+            self._in_message = True
+
+    def _crypt_into(self, data, out) -> int:
+        """GCTR of the next len(data) bytes of the message into `out`."""
+        source = as_bytes_view(data)
+        size = len(source)
+        dest = writable_view(out, size)
+
+        pos = min(len(self._keystream), size)
+        if pos:
+            dest[:pos] = xor_bytes(source[:pos], self._keystream)
+            self._keystream = self._keystream[pos:]
+
+        # Whole blocks straight through GCTR; a trailing partial block keeps
+        # the unused tail of its keystream for the next call
+        aes = self._gcm.aes
+        full = pos + (size - pos) // 16 * 16
+        if full > pos:
+            ctr_xor_into(aes, self._J1, source[pos:full], dest[pos:full], self._counter * 16, 32,
+                         self._gcm.GCTR_CHUNK_BLOCKS)
+            self._counter += (full - pos) // 16
+        if full < size:
+            last = ctr_keystream(aes, self._J1, self._counter * 16, 16, 32)
+            dest[full:] = xor_bytes(source[full:], last)
+            self._keystream = last[size - full:]
+            self._counter += 1
+
+        self._msg_len += size
+        return size
+
+    def update(self, data) -> bytes:
+        """Process the next chunk of the message and return the same number of output bytes."""
+        out = bytearray(len(as_bytes_view(data)))
+        self.update_into(data, out)
+        return bytes(out)
+
+    @abc.abstractmethod
+    def update_into(self, data, out) -> int:
+        """Same as `update`, writing into a caller-provided buffer (may alias `data`)."""
+
+    def finalize(self) -> bytes:
+        """Finish the GHASH and return the tag of length `tag_len` for everything processed."""
+        if self._tag is None:
+            self._hash.flush()
+            lengths = (self._aad_len * 8).to_bytes(8, 'big') + (self._msg_len * 8).to_bytes(8, 'big')
+            S = self._gcm._ghash.update(self._hash.y, lengths).to_bytes(16, 'big')
+            self._tag = self._gcm.GCTR(self._J0, S)[:self._gcm._tag_len]
+        return self._tag
+
+
+class GCMEncryptor(_GCMStream):
+    """Streaming AES-GCM encryption: `update_aad`*, `update`*, then `finalize()` for the tag."""
+
+    def update_into(self, data, out) -> int:
+        self._start_message()
+        written = self._crypt_into(data, out)
+        self._hash.update(as_bytes_view(out)[:written])
+        return written
+
+
+class GCMDecryptor(_GCMStream):
+    """
+    Streaming AES-GCM decryption: `update_aad`*, `update`*, then `verify(tag)`.
+
+    Plaintext returned by `update` is unauthenticated until `verify` succeeds;
+    callers must discard it when `verify` raises.
+    """
+
+    def update_into(self, data, out) -> int:
+        self._start_message()
+        # Hash the ciphertext before it may be overwritten by an in-place decrypt
+        self._hash.update(data)
+        return self._crypt_into(data, out)
+
+    def verify(self, tag: bytes) -> None:
+        """
+        Raises
+        ------
+        ValueError
+            If `tag` is not `tag_len` bytes or does not match the computed tag.
+        """
+        if len(tag) != self._gcm._tag_len or not hmac.compare_digest(self.finalize(), tag):
+            raise ValueError("GCM authentication failed: tag mismatch")
@@ -0,0 +1,162 @@
+import hmac
+
+from src_py.aes_ops.buffer_ops import xor_bytes, xor_fold
+from src_py.aes_ops.key_cache import cached_backend
+
+_MASK_128 = (1 << 128) - 1
+
+
+def _double(x: int) -> int:
+    """Multiply by x in GF(2^128) with the OCB (big-endian, 0x87) convention."""
+    x <<= 1
+    if x >> 128:
+        x = (x & _MASK_128) ^ 0x87
+    return x
+
+
+def _ntz(i: int) -> int:
+    """Number of trailing zero bits of i > 0."""
+    return (i & -i).bit_length() - 1
+
+
+class AES_OCB(object):
+    """
+    AES-OCB3 authenticated encryption (RFC 7253).
+
+    Authentication comes from block-cipher calls and XOR offsets only:
+    block i is masked with Offset_i = Offset_{i-1} XOR L_{ntz(i)} and the
+    tag enciphers the XOR checksum of the plaintext. There is no GF(2^128)
+    multiplication and no chaining, so all offsets are computed up front and
+    every full block of a message (or of the AAD) goes through one
+    multi-block cipher call.
+    """
+
+    def __init__(self, key: bytes, tag_len: int = 16, backend: str = "auto") -> None:
+        """
+        Parameters
+        ----------
+        key : bytes
+            AES key (16, 24 or 32 bytes).
+        tag_len : int, optional
+            Tag length in bytes, 1 to 16 (RFC 7253 TAGLEN / 8).
+        backend : str, optional
+            Name of the block-cipher backend (see `src_py.aes.get_backend`).
+        """
+        if not 1 <= tag_len <= 16:
+            raise ValueError("OCB tag length must be 1 to 16 bytes")
+        self._tag_len = tag_len
+        self.aes = cached_backend(key, backend)
+
+        # L_* = E_K(0^128), L_$ = double(L_*), L_0 = double(L_$), L_i = double(L_{i-1})
+        self._L_star = int.from_bytes(self.aes.encrypt(b'\x00' * 16), 'big')
+        self._L_dollar = _double(self._L_star)
+        self._L = [_double(self._L_dollar)]
+
+    def _L_at(self, i: int) -> int:
+        while len(self._L) <= i:
+            self._L.append(_double(self._L[-1]))
+        return self._L[i]
+
+    def _offsets(self, offset: int, count: int) -> tuple:
+        """
+        Offsets of blocks 1..count starting from Offset_0 = `offset`.
+
+        Returns
+        -------
+        tuple[bytes, int]
+            (count * 16 bytes of offsets, Offset_count).
+        """
+        self._L_at(max(1, count).bit_length())
+        L = self._L
+        out = []
+        for i in range(1, count + 1):
+            offset ^= L[_ntz(i)]
+            out.append(offset.to_bytes(16, 'big'))
+        return b''.join(out), offset
+
+    def _hash(self, aad: bytes) -> int:
+        """HASH(K, A) of RFC 7253, full blocks in one multi-block call."""
+        full = len(aad) // 16
+        offsets, offset = self._offsets(0, full)
+        total = 0
+        if full:
+            enciphered = self.aes.encrypt_blocks(xor_bytes(aad[:16 * full], offsets))
+            total = int.from_bytes(xor_fold(enciphered), 'big')
+        if len(aad) % 16:
+            offset ^= self._L_star
+            block = aad[16 * full:] + b'\x80' + b'\x00' * (15 - len(aad) % 16)
+            total ^= int.from_bytes(self.aes.encrypt(xor_bytes(block, offset.to_bytes(16, 'big'))), 'big')
+        return total
+
+    def _initial_offset(self, nonce: bytes) -> int:
+        """Offset_0 from the nonce: Stretch[1 + bottom .. 128 + bottom]."""
+        if not 1 <= len(nonce) <= 15:
+            raise ValueError("OCB nonce must be 1 to 15 bytes")
+        value = ((self._tag_len * 8) % 128) << 121 | 1 << (8 * len(nonce)) | int.from_bytes(nonce, 'big')
+        bottom = value & 0x3F
+        ktop = int.from_bytes(self.aes.encrypt((value & ~0x3F).to_bytes(16, 'big')), 'big')
+        stretch = (ktop << 64) | ((ktop >> 64) ^ ((ktop >> 56) & ((1 << 64) - 1)))
+        return (stretch >> (64 - bottom)) & _MASK_128
+
+    def _tag(self, checksum: int, offset: int, aad: bytes) -> bytes:
+        block = (checksum ^ offset ^ self._L_dollar).to_bytes(16, 'big')
+        tag = int.from_bytes(self.aes.encrypt(block), 'big') ^ self._hash(aad)
+        return tag.to_bytes(16, 'big')[:self._tag_len]
+
+    def encrypt(self, nonce: bytes, aad: bytes, plaintext: bytes):
+        """
+        Encrypt and authenticate in a single pass.
+
+        Returns
+        -------
+        tuple[bytes, bytes]
+            (ciphertext, tag); the RFC 7253 output is ciphertext || tag.
+        """
+        plaintext = bytes(plaintext)
+        full = len(plaintext) // 16
+        offsets, offset = self._offsets(self._initial_offset(nonce), full)
+
+        # C_i = Offset_i XOR E_K(P_i XOR Offset_i), all full blocks at once
+        body = plaintext[:16 * full]
+        ciphertext = xor_bytes(self.aes.encrypt_blocks(xor_bytes(body, offsets)), offsets) if full else b''
+        checksum = int.from_bytes(xor_fold(body), 'big')
+
+        tail = plaintext[16 * full:]
+        if tail:
+            offset ^= self._L_star
+            pad = self.aes.encrypt(offset.to_bytes(16, 'big'))
+            ciphertext += xor_bytes(tail, pad)
+            checksum ^= int.from_bytes(tail + b'\x80' + b'\x00' * (15 - len(tail)), 'big')
+
+        return ciphertext, self._tag(checksum, offset, bytes(aad))
+
+    def decrypt(self, nonce: bytes, aad: bytes, ciphertext: bytes, tag: bytes) -> bytes:
+        """
+        Decrypt and verify; the plaintext is only returned when the tag matches.
+
+        Raises
+        ------
+        ValueError
+            If the computed authentication tag does not match the provided tag.
+        """
+        ciphertext = bytes(ciphertext)
+        full = len(ciphertext) // 16
+        offsets, offset = self._offsets(self._initial_offset(nonce), full)
+
+        # P_i = Offset_i XOR D_K(C_i XOR Offset_i)
+        body = ciphertext[:16 * full]
+        plaintext = xor_bytes(self.aes.decrypt_blocks(xor_bytes(body, offsets)), offsets) if full else b''
+        checksum = int.from_bytes(xor_fold(plaintext), 'big')
+
+        tail = ciphertext[16 * full:]
+        if tail:
+            offset ^= self._L_star
+            pad = self.aes.encrypt(offset.to_bytes(16, 'big'))
+            tail = xor_bytes(tail, pad)
+            plaintext += tail
+            checksum ^= int.from_bytes(tail + b'\x80' + b'\x00' * (15 - len(tail)), 'big')
+
+        expected_tag = self._tag(checksum, offset, bytes(aad))
+        if not hmac.compare_digest(expected_tag, tag):
+            raise ValueError("OCB authentication failed: tag mismatch")
+        return plaintext
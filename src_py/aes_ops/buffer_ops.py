@@ -0,0 +1,118 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the int path covers every size
+    np = None
+
+# Spans at least this long are XORed with NumPy when it is installed
+NUMPY_XOR_THRESHOLD = 1 << 14
+
+_PLAIN_BYTES = (bytes, bytearray)
+
+
+def as_bytes_view(buf) -> memoryview:
+    """Flat unsigned-byte view of any C-contiguous buffer (bytes, bytearray, memoryview, ndarray, mmap)."""
+    view = memoryview(buf)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+
+def xor_bytes_reference(a: bytes, b: bytes) -> bytes:
+    """Byte-by-byte XOR, kept as the reference for tests and benchmarks."""
+    return bytes([x ^ y for x, y in zip(a, b)])
+
+
+def xor_bytes(a, b) -> bytes:
+    """
+    XOR two buffers as whole spans.
+    Args:
+        a: Any bytes-like buffer.
+        b: Any bytes-like buffer.
+    Returns:
+        bytes: a XOR b, truncated to the shorter input (same as zip).
+    """
+    if type(a) not in _PLAIN_BYTES:
+        a = as_bytes_view(a)
+    if type(b) not in _PLAIN_BYTES:
+        b = as_bytes_view(b)
+    n = min(len(a), len(b))
+    if n < NUMPY_XOR_THRESHOLD or np is None:
+        if n == 0:
+            return b''
+        if len(a) != n:
+            a = a[:n]
+        if len(b) != n:
+            b = b[:n]
+        return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(n, 'big')
+    return np.bitwise_xor(np.frombuffer(a, dtype=np.uint8, count=n),
+                          np.frombuffer(b, dtype=np.uint8, count=n)).tobytes()
+
+
+def xor_into(dst, src) -> None:
+    """
+    XOR `src` into `dst` in place: dst[:n] ^= src[:n] with n = min(len(dst), len(src)).
+    Args:
+        dst: Writable buffer (bytearray, writable memoryview, ndarray, mmap).
+        src: Any bytes-like buffer.
+    """
+    dst = as_bytes_view(dst)
+    if type(src) not in _PLAIN_BYTES:
+        src = as_bytes_view(src)
+    n = min(len(dst), len(src))
+    if n == 0:
+        return
+    if np is not None and n >= NUMPY_XOR_THRESHOLD:
+        d = np.frombuffer(dst, dtype=np.uint8, count=n)
+        np.bitwise_xor(d, np.frombuffer(src, dtype=np.uint8, count=n), out=d)
+        return
+    x = int.from_bytes(dst[:n], 'big') ^ int.from_bytes(src[:n], 'big')
+    dst[:n] = x.to_bytes(n, 'big')
+
+
+def writable_view(buf, size: int) -> memoryview:
+    """
+    Flat writable byte view of a caller-provided output buffer.
+    Args:
+        buf: Writable buffer (bytearray, writable memoryview, ndarray, mmap).
+        size (int): Number of bytes that will be written.
+    Returns:
+        memoryview: View of the first `size` bytes.
+    """
+    view = as_bytes_view(buf)
+    if view.readonly:
+        raise ValueError("Output buffer must be writable")
+    if len(view) < size:
+        raise ValueError(f"Output buffer too small: {len(view)} < {size} bytes")
+    return view[:size]
+
+
+def xor_fold(data, width: int = 16) -> bytes:
+    """
+    XOR of all consecutive `width`-byte words of `data` (e.g. an OCB checksum).
+    Args:
+        data: Any bytes-like buffer whose length is a multiple of `width`.
+        width (int): Word size in bytes.
+    Returns:
+        bytes: `width` bytes, all zero for empty input.
+    """
+    view = as_bytes_view(data)
+    n = len(view)
+    if n % width:
+        raise ValueError(f"Buffer length must be a multiple of {width}")
+    if np is not None and n >= NUMPY_XOR_THRESHOLD:
+        words = np.frombuffer(view, dtype=np.uint8).reshape(-1, width)
+        return np.bitwise_xor.reduce(words, axis=0).tobytes()
+
+    # Halve the big-int span until one word is left; an odd word out is kept aside
+    x = int.from_bytes(view, 'big')
+    words = n // width
+    rest = 0
+    while words > 1:
+        if words & 1:
+            rest ^= x & ((1 << (8 * width)) - 1)
+            x >>= 8 * width
+            words -= 1
+        half = words // 2 * 8 * width
+        x = (x >> half) ^ (x & ((1 << half) - 1))
+        words //= 2
+    return (x ^ rest).to_bytes(width, 'big')
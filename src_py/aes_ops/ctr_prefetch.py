@@ -0,0 +1,206 @@
+import threading
+
+from src_py.aes_ops.aes_ctr import ctr_keystream
+from src_py.aes_ops.buffer_ops import as_bytes_view, xor_into
+
+REFILL_POLICIES = ("background", "manual")
+
+
+class KeystreamPrefetcher:
+    """
+    Ring buffer of CTR keystream generated ahead of use.
+
+    Keystream for the upcoming counter values is produced with the same
+    counter logic as `AES_CTR` / `AES_GCM.GCTR` (`ctr_keystream`) and kept in
+    a fixed-size ring of `depth` blocks. Encrypting a message then costs one
+    XOR against buffered keystream; AES runs outside the send path.
+
+    Refill policies:
+      - "background": a daemon thread refills from the low to the high
+        watermark whenever the level drops below the low watermark.
+      - "manual": the caller runs `refill()` when idle (e.g. between sends);
+        `take` only generates keystream itself when the buffer runs dry.
+
+    Each `take` returns the stream offset of its keystream, which the receiver
+    passes to `AES_CTR.crypt(ciphertext, offset)`. Keystream is never handed
+    out twice.
+    """
+
+    def __init__(self, aes, icb: bytes, counter_bits: int = 64, offset: int = 0, depth: int = 4096,
+                 low_watermark: int = None, high_watermark: int = None, refill: str = "background",
+                 batch_blocks: int = 512) -> None:
+        """
+        Args:
+            aes: Block-cipher backend with `encrypt_blocks`.
+            icb (bytes): 16-byte initial counter block.
+            counter_bits (int): Width of the counter field (32, 64 or 128).
+            offset (int): Stream position in bytes of the first keystream byte handed out.
+            depth (int): Ring capacity in 16-byte blocks.
+            low_watermark (int): Refill starts below this many buffered blocks (default depth // 4).
+            high_watermark (int): Refill stops at this many buffered blocks (default depth).
+            refill (str): "background" or "manual".
+            batch_blocks (int): Blocks generated per refill step.
+        """
+        if refill not in REFILL_POLICIES:
+            raise ValueError(f"Refill policy must be one of {REFILL_POLICIES}")
+        low_watermark = depth // 4 if low_watermark is None else low_watermark
+        high_watermark = depth if high_watermark is None else high_watermark
+        if not 0 <= low_watermark < high_watermark <= depth:
+            raise ValueError("Watermarks must satisfy 0 <= low < high <= depth")
+
+        self.aes = aes
+        self.icb = bytes(icb)
+        self.counter_bits = counter_bits
+        self.depth = depth
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.refill_policy = refill
+        self.batch_blocks = max(1, batch_blocks)
+
+        self._ring = bytearray(depth * 16)
+        # Keystream bytes [_consumed, _generated) are buffered; _generated stays block-aligned
+        self._consumed = offset
+        self._generated = offset - offset % 16
+        self._filling = True
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._take_lock = threading.Lock()
+        self._thread = None
+        if refill == "background":
+            self._thread = threading.Thread(target=self._refill_loop, name="ctr-keystream-refill", daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop the refill thread; waiting and later `take` calls raise ValueError."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def available(self) -> int:
+        """Number of buffered keystream bytes."""
+        with self._cond:
+            return max(0, self._generated - self._consumed)
+
+    def tell(self) -> int:
+        """Stream offset of the next keystream byte to be handed out."""
+        with self._cond:
+            return self._consumed
+
+    def _level_blocks(self) -> int:
+        return max(0, self._generated - self._consumed) // 16
+
+    def _next_batch(self) -> tuple:
+        """(start, blocks) of the next refill step; call with the condition held."""
+        # Ring blocks still in use, counting a partly consumed first block
+        used = (self._generated - (self._consumed - self._consumed % 16)) // 16
+        return self._generated, min(self.batch_blocks, self.high_watermark - used)
+
+    def _store(self, start: int, keystream: bytes) -> None:
+        """Write generated keystream at stream position `start` into the ring; condition held."""
+        capacity = len(self._ring)
+        pos = start % capacity
+        first = min(len(keystream), capacity - pos)
+        self._ring[pos:pos + first] = keystream[:first]
+        self._ring[:len(keystream) - first] = keystream[first:]
+        self._generated = start + len(keystream)
+        self._cond.notify_all()
+
+    def _generate(self, start: int, blocks: int) -> bytes:
+        return ctr_keystream(self.aes, self.icb, start, blocks * 16, self.counter_bits)
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped and not self._filling:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                start, blocks = self._next_batch()
+                if blocks <= 0:
+                    self._filling = False
+                    continue
+
+            # AES runs without the lock; only this thread writes past _generated
+            keystream = self._generate(start, blocks)
+
+            with self._cond:
+                self._store(start, keystream)
+                if self._level_blocks() >= self.high_watermark:
+                    self._filling = False
+
+    def refill(self) -> int:
+        """
+        Fill the ring up to the high watermark in the calling thread ("manual" policy).
+        Returns:
+            int: Number of blocks generated.
+        """
+        if self.refill_policy != "manual":
+            raise RuntimeError("refill() is only used with the 'manual' refill policy")
+        total = 0
+        with self._cond:
+            while True:
+                start, blocks = self._next_batch()
+                if blocks <= 0:
+                    return total
+                self._store(start, self._generate(start, blocks))
+                total += blocks
+
+    def take(self, n: int) -> tuple:
+        """
+        Hand out the next `n` keystream bytes.
+        Returns:
+            tuple: (stream offset, keystream bytes).
+        Raises:
+            ValueError: If the prefetcher is closed, including while waiting for a refill.
+        """
+        out = bytearray(n)
+        capacity = len(self._ring)
+        with self._take_lock, self._cond:
+            offset = self._consumed
+            pos = 0
+            while pos < n:
+                if self._stopped:
+                    raise ValueError("Prefetcher closed")
+                buffered = self._generated - self._consumed
+                if buffered <= 0:
+                    if self.refill_policy == "manual":
+                        start, blocks = self._next_batch()
+                        self._store(start, self._generate(start, max(1, min(blocks, -(-(n - pos) // 16)))))
+                    else:
+                        self._filling = True
+                        self._cond.notify_all()
+                        self._cond.wait()
+                    continue
+
+                ring_pos = self._consumed % capacity
+                k = min(buffered, n - pos, capacity - ring_pos)
+                out[pos:pos + k] = self._ring[ring_pos:ring_pos + k]
+                self._consumed += k
+                pos += k
+
+                if self.refill_policy == "background" and self._level_blocks() < self.low_watermark:
+                    self._filling = True
+                    self._cond.notify_all()
+        return offset, bytes(out)
+
+    def encrypt(self, data) -> tuple:
+        """
+        XOR `data` with the next buffered keystream.
+        Returns:
+            tuple: (stream offset, ciphertext); decrypt with `AES_CTR.crypt(ciphertext, offset)`.
+        """
+        source = as_bytes_view(data)
+        offset, keystream = self.take(len(source))
+        out = bytearray(keystream)
+        xor_into(out, source)
+        return offset, bytes(out)
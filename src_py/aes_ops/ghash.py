@@ -0,0 +1,331 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only GHashBatch needs it
+    np = None
+
+# R = 0xE1|120 bit 0 (GCM reduction constant)
+R = 0xE1000000000000000000000000000000
+
+
+def gf_mul(x: int, y: int) -> int:
+    """
+    Bit-serial multiplication in GF(2^128) with GCM bit ordering.
+
+    Same algorithm as `AES_GCM.mul`, on 128-bit integers (big-endian block
+    value, bit 127 is the coefficient of x^0).
+    """
+    z = 0
+    v = y
+    for i in range(128):
+        if (x >> (127 - i)) & 1:
+            z ^= v
+        if v & 1:
+            v = (v >> 1) ^ R
+        else:
+            v >>= 1
+    return z
+
+
+class GHashTable:
+    """
+    Precomputed multiplication-by-H tables for GHASH.
+
+    Multiplication by a fixed H is linear, so X * H is the XOR over every
+    `window`-bit digit of X of (digit * x^position) * H. All of these products
+    are computed once per key:
+      - window=8: 16 tables of 256 entries (16 lookups per block),
+      - window=4: 32 tables of 16 entries (32 lookups per block, less memory).
+    """
+
+    def __init__(self, H: bytes, window: int = 8) -> None:
+        if window not in (4, 8):
+            raise ValueError("GHASH table window must be 4 or 8 bits")
+        self.window = window
+        self.H = int.from_bytes(H, 'big') if isinstance(H, (bytes, bytearray)) else H
+
+        # bit_products[k] = (1 << k) * H, i.e. H * x^(127 - k)
+        bit_products = [0] * 128
+        v = self.H
+        for i in range(128):
+            bit_products[127 - i] = v
+            v = (v >> 1) ^ R if v & 1 else v >> 1
+
+        size = 1 << window
+        tables = []
+        for pos in range(128 // window):
+            shift = 128 - window * (pos + 1)
+            table = [0] * size
+            for digit in range(1, size):
+                low = digit & -digit
+                table[digit] = table[digit ^ low] ^ bit_products[shift + low.bit_length() - 1]
+            tables.append(table)
+        self._tables = tables
+
+    def mul_h(self, x: int) -> int:
+        """Return x * H in GF(2^128)."""
+        z = 0
+        if self.window == 8:
+            for table, digit in zip(self._tables, x.to_bytes(16, 'big')):
+                z ^= table[digit]
+        else:
+            for table, shift in zip(self._tables, range(124, -1, -4)):
+                z ^= table[(x >> shift) & 0xF]
+        return z
+
+    def update(self, y: int, data) -> int:
+        """
+        Fold whole 16-byte blocks of `data` into the running GHASH value `y`.
+
+        Parameters
+        ----------
+        y : int
+            Current GHASH state (0 for a fresh hash).
+        data : bytes-like
+            Input whose length is a multiple of 16.
+
+        Returns
+        -------
+        int
+            The updated GHASH state.
+        """
+        view = memoryview(data)
+        from_bytes = int.from_bytes
+        if self.window == 8:
+            tables = self._tables
+            for i in range(0, len(view) - 15, 16):
+                z = 0
+                for table, digit in zip(tables, (y ^ from_bytes(view[i:i + 16], 'big')).to_bytes(16, 'big')):
+                    z ^= table[digit]
+                y = z
+        else:
+            mul_h = self.mul_h
+            for i in range(0, len(view) - 15, 16):
+                y = mul_h(y ^ from_bytes(view[i:i + 16], 'big'))
+        return y
+
+    def ghash(self, data) -> bytes:
+        """Compute GHASH_H(data) for input whose length is a multiple of 16."""
+        return self.update(0, data).to_bytes(16, 'big')
+
+
+# Multiplicative identity of GF(2^128) in GCM bit ordering
+ONE = 1 << 127
+
+
+def gf_pow(h: int, n: int) -> int:
+    """Return h^n in GF(2^128) by square-and-multiply (h^0 = 1)."""
+    result = ONE
+    while n:
+        if n & 1:
+            result = gf_mul(result, h)
+        h = gf_mul(h, h)
+        n >>= 1
+    return result
+
+
+class GHashPowers:
+    """
+    Aggregated GHASH over precomputed powers H, H^2, ..., H^k.
+
+    k blocks are folded per step:
+        Y_new = (Y XOR X_1) * H^k XOR X_2 * H^(k-1) XOR ... XOR X_k * H
+    which needs one int conversion per group instead of one per block and
+    removes the block-to-block dependency inside a group. The same powers let
+    GHASH values of independent chunks be combined afterwards (`combine`).
+    """
+
+    def __init__(self, H: bytes, k: int = 4, window: int = 8) -> None:
+        if k < 1:
+            raise ValueError("Aggregation factor k must be at least 1")
+        self.k = k
+        self.window = window
+        self.H = int.from_bytes(H, 'big') if isinstance(H, (bytes, bytearray)) else H
+
+        powers = [self.H]
+        for _ in range(k - 1):
+            powers.append(gf_mul(powers[-1], self.H))
+        self._powers = powers
+        # _power_tables[i] multiplies by H^(i + 1)
+        self._power_tables = [GHashTable(p, window) for p in powers]
+        # Per-byte tables for a full group: block j of the group is multiplied by H^(k - j)
+        self._group_tables = self._byte_tables(k) if window == 8 else None
+
+    def _byte_tables(self, blocks: int) -> list:
+        """Flat list of 8-bit tables for `blocks` consecutive blocks ending with H^1."""
+        tables = []
+        for j in range(blocks):
+            tables.extend(self._power_tables[blocks - 1 - j]._tables)
+        return tables
+
+    def power(self, n: int) -> int:
+        """Return H^n (cached for n <= k)."""
+        if 1 <= n <= self.k:
+            return self._powers[n - 1]
+        return gf_pow(self.H, n)
+
+    def mul_h(self, x: int) -> int:
+        """Return x * H in GF(2^128)."""
+        return self._power_tables[0].mul_h(x)
+
+    def _fold(self, y: int, view, start: int, blocks: int) -> int:
+        """Fold `blocks` (<= k) blocks starting at `start` into y in one aggregated step."""
+        head = (y ^ int.from_bytes(view[start:start + 16], 'big'))
+        if self.window == 8:
+            tables = self._group_tables if blocks == self.k else self._byte_tables(blocks)
+            z = 0
+            for table, digit in zip(tables, head.to_bytes(16, 'big') + bytes(view[start + 16:start + 16 * blocks])):
+                z ^= table[digit]
+            return z
+
+        z = self._power_tables[blocks - 1].mul_h(head)
+        for j in range(1, blocks):
+            offset = start + 16 * j
+            z ^= self._power_tables[blocks - 1 - j].mul_h(int.from_bytes(view[offset:offset + 16], 'big'))
+        return z
+
+    def update(self, y: int, data) -> int:
+        """
+        Fold whole 16-byte blocks of `data` into the running GHASH value `y`.
+
+        Parameters
+        ----------
+        y : int
+            Current GHASH state (0 for a fresh hash).
+        data : bytes-like
+            Input whose length is a multiple of 16.
+
+        Returns
+        -------
+        int
+            The updated GHASH state.
+        """
+        view = memoryview(data)
+        num_blocks = len(view) // 16
+        k = self.k
+        full = num_blocks - num_blocks % k
+
+        if self.window == 8:
+            tables = self._group_tables
+            from_bytes = int.from_bytes
+            for start in range(0, 16 * full, 16 * k):
+                z = 0
+                group = (y ^ from_bytes(view[start:start + 16], 'big')).to_bytes(16, 'big') + \
+                    view[start + 16:start + 16 * k].tobytes()
+                for table, digit in zip(tables, group):
+                    z ^= table[digit]
+                y = z
+        else:
+            for start in range(0, 16 * full, 16 * k):
+                y = self._fold(y, view, start, k)
+        if full < num_blocks:
+            y = self._fold(y, view, 16 * full, num_blocks - full)
+        return y
+
+    def ghash(self, data) -> bytes:
+        """Compute GHASH_H(data) for input whose length is a multiple of 16."""
+        return self.update(0, data).to_bytes(16, 'big')
+
+    def update_padded(self, y: int, data) -> int:
+        """Fold `data` zero-padded to a whole number of blocks into `y`, copying only the last partial block."""
+        view = memoryview(data)
+        full = len(view) - len(view) % 16
+        y = self.update(y, view[:full])
+        if full < len(view):
+            y = self.update(y, bytes(view[full:]).ljust(16, b'\x00'))
+        return y
+
+    def combine(self, y_left: int, y_right: int, right_blocks: int) -> int:
+        """
+        Combine GHASH values of two adjacent chunks.
+
+        Parameters
+        ----------
+        y_left : int
+            GHASH state after the left chunk (or of the left chunk alone).
+        y_right : int
+            GHASH of the right chunk started from 0.
+        right_blocks : int
+            Number of 16-byte blocks in the right chunk.
+
+        Returns
+        -------
+        int
+            GHASH state of left || right: y_left * H^right_blocks XOR y_right.
+        """
+        if right_blocks == 0:
+            return y_left
+        if y_left == 0:
+            return y_right
+        return gf_mul(y_left, self.power(right_blocks)) ^ y_right
+
+
+class GHashBatch:
+    """
+    GHASH of many independent messages at once, one NumPy lane per message.
+
+    Each lane holds a 128-bit state as two uint64 words. One step folds the
+    next block of every message still running: the state bytes index the
+    16 per-byte tables of `GHashTable(H, 8)` for all lanes together, and the
+    16 looked-up halves are XOR-reduced. Messages are sorted longest first,
+    so the lanes still running at step j are a prefix (ragged lengths need
+    no per-block masking).
+    """
+
+    def __init__(self, H: bytes) -> None:
+        if np is None:
+            raise ImportError("GHashBatch requires NumPy")
+        tables = GHashTable(H, 8)._tables
+        mask = (1 << 64) - 1
+        self._hi = np.array([[v >> 64 for v in table] for table in tables], dtype=np.uint64)
+        self._lo = np.array([[v & mask for v in table] for table in tables], dtype=np.uint64)
+        self._positions = np.arange(16)
+
+    def update_many(self, messages) -> list:
+        """
+        GHASH states of many messages, each started from 0.
+
+        Parameters
+        ----------
+        messages : list of bytes-like
+            Inputs whose lengths are multiples of 16; lengths may differ.
+
+        Returns
+        -------
+        list[int]
+            One GHASH state per message, in input order.
+        """
+        views = [memoryview(m).cast('B') for m in messages]
+        if any(len(v) % 16 for v in views):
+            raise ValueError("GHASH input length must be a multiple of 16")
+        if not views:
+            return []
+
+        blocks = [len(v) // 16 for v in views]
+        order = sorted(range(len(views)), key=lambda i: -blocks[i])
+        steps = blocks[order[0]]
+
+        data = np.zeros((len(views), steps, 2), dtype=np.uint64)
+        active = np.zeros(steps + 1, dtype=np.int64)
+        for row, i in enumerate(order):
+            if blocks[i]:
+                data[row, :blocks[i]] = np.frombuffer(views[i], dtype='>u8').reshape(-1, 2)
+            active[blocks[i]] += 1
+        # active[j] = number of messages with more than j blocks
+        active = np.cumsum(active[::-1])[::-1][1:]
+
+        y = np.zeros((len(views), 2), dtype=np.uint64)
+        positions = self._positions
+        for j in range(steps):
+            k = int(active[j])
+            digits = (y[:k] ^ data[:k, j]).astype('>u8').view(np.uint8).reshape(k, 16)
+            y[:k, 0] = np.bitwise_xor.reduce(self._hi[positions, digits], axis=1)
+            y[:k, 1] = np.bitwise_xor.reduce(self._lo[positions, digits], axis=1)
+
+        results = [0] * len(views)
+        for row, i in enumerate(order):
+            results[i] = (int(y[row, 0]) << 64) | int(y[row, 1])
+        return results
+
+    def ghash_many(self, messages) -> list:
+        """Compute GHASH_H(m) for every message; returns 16-byte values in input order."""
+        return [y.to_bytes(16, 'big') for y in self.update_many(messages)]
@@ -1,5 +1,4 @@
-def xor_bytes(a: bytes, b: bytes):
-    return bytes([x ^ y for x, y in zip(a, b)])
+from src_py.aes_ops.buffer_ops import xor_bytes, xor_into
 
 
 def pkcs7_pad(data: bytes, block_size: int = 16) -> bytes:
@@ -9,6 +8,39 @@ def pkcs7_pad(data: bytes, block_size: int = 16) -> bytes:
     return data + padding
 
 
+def pkcs7_last_block(data, block_size: int = 16) -> tuple:
+    """
+    PKCS#7 padding without copying the whole input.
+    Args:
+        data: Plaintext buffer.
+        block_size (int): Block size in bytes.
+    Returns:
+        tuple: (full_len, last_block) where data[:full_len] are the unpadded
+            whole blocks and last_block is the padded final block.
+    """
+    full_len = len(data) - len(data) % block_size
+    padding_length = block_size - (len(data) - full_len)
+    return full_len, bytes(data[full_len:]) + bytes([padding_length] * padding_length)
+
+
+def counter_blocks(icb: bytes, count: int, offset: int = 0, counter_bits: int = 32) -> bytes:
+    """
+    Build `count` consecutive counter blocks starting `offset` increments after `icb`.
+    Args:
+        icb (bytes): 16-byte initial counter block (prefix || big-endian counter).
+        count (int): Number of counter blocks.
+        offset (int): Number of increments applied to `icb` before the first block.
+        counter_bits (int): Width of the counter field in the low bits (32, 64 or 128).
+    Returns:
+        bytes: count * 16 bytes of counter blocks; the counter wraps modulo 2^counter_bits.
+    """
+    counter_len = counter_bits // 8
+    prefix = bytes(icb[:16 - counter_len])
+    mask = (1 << counter_bits) - 1
+    start = int.from_bytes(icb[16 - counter_len:], 'big') + offset
+    return b''.join([prefix + ((start + i) & mask).to_bytes(counter_len, 'big') for i in range(count)])
+
+
 def pkcs7_unpad(padded_text: bytes) -> bytes:
     """Remove PKCS#7 padding from data."""
     padding_length = padded_text[-1]
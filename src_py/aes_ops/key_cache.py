@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+
+from src_py.aes import get_backend
+from src_py.aes_ops.ghash import GHashPowers
+
+
+class KeyContextCache:
+    """
+    Bounded, thread-safe LRU cache of per-key precomputation.
+
+    Entries are keyed by (kind, parameters, key bytes) and hold whatever the
+    factory built: block-cipher backends (encryption and decryption round
+    keys), or the hash subkey H with its GHASH tables. Contexts are built
+    outside the lock; if two threads miss on the same key at once, the first
+    stored context wins.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, kind: tuple, key: bytes, factory):
+        """
+        Return the cached context for (kind, key), building it with factory() on a miss.
+        Args:
+            kind (tuple): Context type and its parameters, e.g. ("aes", "auto").
+            key (bytes): AES key.
+            factory: Callable without arguments returning the context.
+        """
+        cache_key = (kind, bytes(key))
+        with self._lock:
+            context = self._entries.get(cache_key)
+            if context is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return context
+            self.misses += 1
+
+        context = factory()
+        with self._lock:
+            context = self._entries.setdefault(cache_key, context)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return context
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self) -> None:
+        """Drop every cached context (key material included) and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache used by the mode helpers
+default_key_cache = KeyContextCache()
+
+
+def cached_backend(key: bytes, backend: str = "auto", cache: KeyContextCache = None):
+    """Block-cipher backend for `key` from the cache (see `src_py.aes.get_backend`)."""
+    if cache is None:
+        cache = default_key_cache
+    return cache.get(("aes", backend), key, lambda: get_backend(backend, key))
+
+
+def cached_gcm_key(key: bytes, backend: str = "auto", ghash_window: int = 8, ghash_aggregate: int = 4,
+                   cache: KeyContextCache = None) -> tuple:
+    """
+    GCM key material from the cache.
+    Returns:
+        tuple: (backend, H, GHashPowers over H).
+    """
+    if cache is None:
+        cache = default_key_cache
+
+    def build():
+        aes = cached_backend(key, backend, cache)
+        H = aes.encrypt(b'\x00' * 16)
+        return aes, H, GHashPowers(H, ghash_aggregate, ghash_window)
+
+    return cache.get(("gcm", backend, ghash_window, ghash_aggregate), key, build)
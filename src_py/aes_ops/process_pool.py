@@ -0,0 +1,78 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+
+# Per-process context (block cipher or GCM context), built once by the pool initializer
+_worker_context = None
+
+
+def _init_worker(factory, args):
+    global _worker_context
+    _worker_context = factory(*args)
+
+
+def worker_context():
+    """The context the pool initializer built in this worker process."""
+    return _worker_context
+
+
+def pool_settings(workers: int, chunk_size: int) -> tuple:
+    """
+    Resolve the worker count (default: os.cpu_count()) and round the chunk size down to whole blocks.
+    Returns:
+        tuple: (workers, chunk_size).
+    """
+    return workers or os.cpu_count() or 1, max(16, chunk_size - chunk_size % 16)
+
+
+def use_serial(n: int, workers: int, chunk_size: int) -> bool:
+    """True when one worker is configured or the payload is shorter than two chunks."""
+    return workers <= 1 or n < 2 * chunk_size
+
+
+def start_pool(workers: int, factory, *args) -> ProcessPoolExecutor:
+    """Process pool whose workers each build `factory(*args)` once (see `worker_context`)."""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(factory, args))
+
+
+def map_chunks(pool: ProcessPoolExecutor, task, n: int, workers: int, chunk_size: int, *args) -> list:
+    """
+    Run task(start, end, *args) over block-aligned ranges covering [0, n).
+
+    Ranges are at most `chunk_size` bytes and small enough to give every
+    worker a share.
+    Returns:
+        list: Task results in range order.
+    """
+    per_worker = -(-n // workers)
+    chunk = min(chunk_size, per_worker + (-per_worker) % 16)
+    futures = [pool.submit(task, start, min(start + chunk, n), *args) for start in range(0, n, chunk)]
+    return [future.result() for future in futures]
+
+
+@contextmanager
+def shared_buffers(size: int, count: int = 1):
+    """Create `count` shared-memory segments of `size` bytes; closed and unlinked on exit."""
+    segments = []
+    try:
+        for _ in range(count):
+            segments.append(SharedMemory(create=True, size=size))
+        yield segments
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+@contextmanager
+def attach(*names):
+    """Worker side: open shared-memory segments by name and close them on exit."""
+    segments = []
+    try:
+        for name in names:
+            segments.append(SharedMemory(name=name))
+        yield segments
+    finally:
+        for shm in segments:
+            shm.close()
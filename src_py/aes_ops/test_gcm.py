@@ -1,4 +1,9 @@
-from .aes_gcm import AES_GCM
+import os
+
+from .aes_gcm import AES_GCM, AES_GCM_Key
+from .aes_gcm_parallel import AES_GCM_Parallel
+from .ghash import GHashTable, GHashPowers, GHashBatch
+from src_py.aes import available_backends
 
 
 def run_test():
@@ -77,15 +82,15 @@ def run_test():
         },
     ]
 
-    print(f"{'TEST NAME':<65} | {'CT':<6} | {'TAG':<6} | {'DEC':<6}")
+    print(f"{'TEST NAME':<65} | {'BACKEND':<10} | {'CT':<6} | {'TAG':<6} | {'DEC':<6}")
 
-    for v in vectors:
+    for v, backend in [(v, b) for v in vectors for b in available_backends()]:
         key = bytes.fromhex(v["key"])
         iv = bytes.fromhex(v["iv"])
         aad = bytes.fromhex(v["aad"])
         pt = bytes.fromhex(v["pt"])
 
-        gcm = AES_GCM(key, iv, aad)
+        gcm = AES_GCM(key, iv, aad, backend=backend)
 
         # Encrypt
         ct_out, tag_out = gcm.encrypt_gcm(pt)
@@ -100,7 +105,92 @@ def run_test():
         pt_dec = gcm.decrypt_gcm(ct_out, tag_out)
         dec_check = "PASS" if pt_dec == pt else "FAIL"
 
-        print(f"{v['name']:<65} | {ct_check:<6} | {tag_check:<6} | {dec_check:<6}")
+        # Fused decrypt-and-verify must reject a flipped bit without releasing plaintext
+        if ct_out:
+            tampered = bytes([ct_out[0] ^ 1]) + ct_out[1:]
+            try:
+                gcm.decrypt_gcm(tampered, tag_out)
+                dec_check = "FAIL"
+            except ValueError:
+                pass
+
+        # Tags shorter than tag_len never authenticate, whatever the path
+        for short_tag in (b"", tag_out[:1]):
+            for decrypt in (lambda t: gcm.decrypt_gcm(ct_out, t),
+                            lambda t: gcm.decrypt_gcm_into(ct_out, t, bytearray(len(ct_out)))):
+                try:
+                    decrypt(short_tag)
+                    dec_check = "FAIL"
+                except ValueError:
+                    pass
+
+        # Zero-copy API, in place on one buffer
+        buf = bytearray(pt)
+        tag_into = gcm.encrypt_gcm_into(buf, buf)
+        if bytes(buf) != ct_out or tag_into != tag_out:
+            ct_check = "FAIL"
+        if gcm.decrypt_gcm_into(buf, tag_into, buf) != len(pt) or bytes(buf) != pt:
+            dec_check = "FAIL"
+
+        # Incremental re-seal after in-place edits equals sealing the edited plaintext
+        if pt:
+            edited = bytearray(pt)
+            edits = [(len(pt) // 3, b'\xaa' * (len(pt) // 3)), (len(pt) - 1, b'\x01')]
+            for offset, data in edits:
+                edited[offset:offset + len(data)] = data
+            if gcm.reseal_gcm(ct_out, tag_out, edits, allow_nonce_reuse=True) != gcm.encrypt_gcm(bytes(edited)):
+                tag_check = "FAIL"
+            try:
+                gcm.reseal_gcm(ct_out, tag_out, edits)
+                tag_check = "FAIL"
+            except ValueError:
+                pass
+
+        # Key-scoped context, nonce and AAD per message
+        gcm_key = AES_GCM_Key(key, backend=backend)
+        if gcm_key.seal(iv, aad, pt) != (ct_out, tag_out):
+            ct_check = "FAIL"
+        if gcm_key.open(iv, aad, ct_out, tag_out) != pt:
+            dec_check = "FAIL"
+        for short_tag in (b"", tag_out[:1], tag_out[:12]):
+            try:
+                gcm_key.open(iv, aad, ct_out, short_tag)
+                dec_check = "FAIL"
+            except ValueError:
+                pass
+        bad_tag = bytes([tag_out[0] ^ 1]) + tag_out[1:]
+        checks = [tag_out, bad_tag, tag_out[:12], b""]
+        if gcm_key.verify_many([(iv, aad, ct_out, t) for t in checks]) != [True, False, False, False]:
+            tag_check = "FAIL"
+        if gcm_key.seal_many([(iv, aad, pt), (iv, b"", pt[:5])]) != [(ct_out, tag_out), gcm_key.seal(iv, b"", pt[:5])]:
+            ct_check = "FAIL"
+        opened = gcm_key.open_many([(iv, aad, ct_out, t) for t in (bad_tag, tag_out, tag_out[:12], b"")])
+        if any(plain is not None for plain, _ in opened[2:]) or opened[0][0] is not None or opened[1] != (pt, None):
+            dec_check = "FAIL"
+
+        # Streaming API, in odd-sized chunks
+        enc = gcm.encryptor()
+        ct_stream = b''.join(enc.update(pt[i:i + 7]) for i in range(0, len(pt), 7))
+        if ct_stream != ct_out or enc.finalize() != tag_out:
+            ct_check = "FAIL"
+        dec = gcm.decryptor()
+        pt_stream = b''.join(dec.update(ct_out[i:i + 5]) for i in range(0, len(ct_out), 5))
+        try:
+            dec.verify(tag_out)
+        except ValueError:
+            dec_check = "FAIL"
+        if pt_stream != pt:
+            dec_check = "FAIL"
+        for bad in (bytes([tag_out[0] ^ 1]) + tag_out[1:], b"", tag_out[:12]):
+            dec = gcm.decryptor()
+            dec.update(ct_out)
+            try:
+                dec.verify(bad)
+                dec_check = "FAIL"
+            except ValueError:
+                pass
+
+        print(f"{v['name']:<65} | {backend:<10} | {ct_check:<6} | {tag_check:<6} | {dec_check:<6}")
 
         if ct_check == "FAIL" or tag_check == "FAIL" or dec_check == "FAIL":
             print(f"   Expected CT:  {v['ct']}")
@@ -109,6 +199,50 @@ def run_test():
             print(f"   Got Tag:      {tag_hex}")
             print(f"   PT match:     {dec_check}")
 
+    # Table-driven GHASH must match the bit-serial reference `mul`
+    gcm = AES_GCM(os.urandom(16), os.urandom(12), b"")
+    data = os.urandom(16 * 40)
+    y = b'\x00' * 16
+    for i in range(0, len(data), 16):
+        y = gcm.mul(bytes(a ^ b for a, b in zip(y, data[i:i + 16])), gcm.H)
+    for window in (4, 8):
+        check = "PASS" if GHashTable(gcm.H, window).ghash(data) == y else "FAIL"
+        name = f"GHASH {window}-bit tables vs bit-serial mul"
+        print(f"{name:<65} | {'-':<10} | {'-':<6} | {check:<6} | {'-':<6}")
+
+        for k in (2, 4, 8):
+            powers = GHashPowers(gcm.H, k, window)
+            split = 16 * 13
+            combined = powers.combine(powers.update(0, data[:split]), powers.update(0, data[split:]),
+                                      (len(data) - split) // 16)
+            ok = powers.ghash(data) == y and combined.to_bytes(16, 'big') == y
+            name = f"Aggregated GHASH k={k}, {window}-bit tables (+ chunk combine)"
+            print(f"{name:<65} | {'-':<10} | {'-':<6} | {('PASS' if ok else 'FAIL'):<6} | {'-':<6}")
+
+    # Batched GHASH over ragged messages must match one GHASH per message
+    messages = [data[:16 * n] for n in (0, 1, 7, 40, 3, 3)]
+    ok = GHashBatch(gcm.H).ghash_many(messages) == [GHashTable(gcm.H).ghash(m) for m in messages]
+    name = "Batched NumPy GHASH, ragged messages"
+    print(f"{name:<65} | {'-':<10} | {'-':<6} | {('PASS' if ok else 'FAIL'):<6} | {'-':<6}")
+
+    # Process pool must be byte-identical to the serial path
+    key, iv, aad = os.urandom(16), os.urandom(12), os.urandom(20)
+    pt = os.urandom(100_003)
+    ct, tag = AES_GCM(key, iv, aad).encrypt_gcm(pt)
+    with AES_GCM_Parallel(key, iv, aad, workers=2, chunk_size=1 << 14) as gcm_par:
+        ct_par, tag_par = gcm_par.encrypt_gcm(pt)
+        ct_check = "PASS" if ct_par == ct else "FAIL"
+        tag_check = "PASS" if tag_par == tag else "FAIL"
+        dec_check = "PASS" if gcm_par.decrypt_gcm(ct, tag) == pt else "FAIL"
+        for bad in (bytes([tag[0] ^ 1]) + tag[1:], b"", tag[:12]):
+            try:
+                gcm_par.decrypt_gcm(ct, bad)
+                dec_check = "FAIL"
+            except ValueError:
+                pass
+    name = "Parallel GCM (2 workers, 16 KiB chunks) vs serial"
+    print(f"{name:<65} | {'-':<10} | {ct_check:<6} | {tag_check:<6} | {dec_check:<6}")
+
 
 if __name__ == "__main__":
     run_test()
@@ -0,0 +1,164 @@
+import os
+import subprocess
+
+import numpy as np
+
+from src_py.aes import get_backend
+from .aes_cbc import AES_CBC, encrypt_cbc, decrypt_cbc, encrypt_cbc_into, decrypt_cbc_into, encrypt_cbc_many
+from .aes_cbc_parallel import decrypt_cbc_parallel
+from .aes_ctr import AES_CTR
+from .key_cache import KeyContextCache, cached_backend
+from .aes_ecb import encrypt_ecb, decrypt_ecb, encrypt_ecb_into, decrypt_ecb_into, encrypt_ecb_aes, decrypt_ecb_aes
+from .aes_ecb_parallel import encrypt_ecb_parallel, decrypt_ecb_parallel
+
+
+def _openssl_enc(mode: str, key: bytes, iv: bytes, plaintext: bytes):
+    """Reference ciphertext from the openssl CLI, None when it is not installed."""
+    try:
+        result = subprocess.run(
+            ["openssl", "enc", f"-aes-128-{mode}", "-K", key.hex()] + (["-iv", iv.hex()] if iv else []),
+            input=plaintext, capture_output=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def run_test():
+    print(f"{'TEST NAME':<65} | {'RESULT':<6}")
+
+    def report(name, ok):
+        print(f"{name:<65} | {('PASS' if ok else 'FAIL'):<6}")
+
+    key = os.urandom(16)
+    iv = os.urandom(16)
+    for size in (0, 15, 16, 33, 4096 + 7):
+        pt = os.urandom(size)
+        ct, _ = encrypt_cbc(pt, key, iv)
+        expected = _openssl_enc("cbc", key, iv, pt)
+        if expected is not None:
+            report(f"CBC {size} bytes vs openssl", ct == expected)
+
+        # Separate output buffer
+        out = bytearray(len(ct))
+        written, _ = encrypt_cbc_into(pt, out, key, iv)
+        report(f"CBC encrypt_into {size} bytes", written == len(ct) and bytes(out) == ct)
+
+        # In place: plaintext at the start of a buffer with room for the padding
+        buf = bytearray(len(ct))
+        buf[:size] = pt
+        encrypt_cbc_into(memoryview(buf)[:size], buf, key, iv)
+        n = decrypt_cbc_into(buf, buf, key, iv)
+        report(f"CBC in-place round trip {size} bytes", bytes(buf) != pt and bytes(buf[:n]) == pt)
+
+        # NumPy output buffer
+        arr = np.zeros(len(ct), dtype=np.uint8)
+        n = decrypt_cbc_into(ct, arr, key, iv)
+        report(f"CBC decrypt_into ndarray {size} bytes", arr[:n].tobytes() == decrypt_cbc(ct, key, iv))
+
+        # Streaming contexts fed in odd-sized chunks
+        cbc = AES_CBC(get_backend("auto", key))
+        enc = cbc.encryptor(key, iv)
+        ct_stream = b''.join(enc.update(pt[i:i + 7]) for i in range(0, size, 7)) + enc.finalize()
+        dec = cbc.decryptor(key, iv)
+        pt_stream = b''.join(dec.update(ct[i:i + 5]) for i in range(0, len(ct), 5)) + dec.finalize()
+        report(f"CBC streaming round trip {size} bytes", ct_stream == ct and pt_stream == pt)
+
+    # CBC decryption across a process pool matches the serial path
+    pt = os.urandom(100_003)
+    ct, _ = encrypt_cbc(pt, key, iv)
+    report("CBC decrypt process pool matches serial",
+           decrypt_cbc_parallel(ct, key, iv, workers=2, chunk_size=1 << 14) == pt == decrypt_cbc(ct, key, iv))
+
+    # Multi-stream CBC: lock-step chains equal one encrypt_cbc per job
+    keys = [os.urandom(16), os.urandom(16)]
+    jobs = [(os.urandom(n), keys[n % 2], None if n % 3 else os.urandom(16)) for n in (0, 1, 16, 31, 64, 300, 17, 1000)]
+    results = encrypt_cbc_many(jobs)
+    ok = all(encrypt_cbc(pt, k, iv_used)[0] == ct for (pt, k, _), (ct, iv_used) in zip(jobs, results))
+    report("CBC multi-stream lock-step encryption", ok)
+
+    ecb_key = os.urandom(16)
+    pt = os.urandom(100)
+    ct = encrypt_ecb(ecb_key, pt)
+    buf = bytearray(len(ct))
+    buf[:len(pt)] = pt
+    written = encrypt_ecb_into(ecb_key, memoryview(buf)[:len(pt)], buf)
+    report("ECB encrypt_into in place", written == len(ct) and bytes(buf) == ct)
+    n = decrypt_ecb_into(ecb_key, buf, buf)
+    report("ECB decrypt_into in place", bytes(buf[:n]) == pt == decrypt_ecb(ecb_key, ct))
+
+    # Real AES-ECB, serial and across a process pool
+    pt = os.urandom(100_003)
+    ct = encrypt_ecb_aes(key, pt)
+    expected = _openssl_enc("ecb", key, b'', pt)
+    if expected is not None:
+        report("AES-ECB vs openssl", ct == expected)
+    ok = encrypt_ecb_parallel(key, pt, workers=2, chunk_size=1 << 14) == ct
+    ok = ok and decrypt_ecb_parallel(key, ct, workers=2, chunk_size=1 << 14) == pt == decrypt_ecb_aes(key, ct)
+    report("AES-ECB process pool matches serial", ok)
+
+    # CTR: full 128-bit counter matches openssl, any byte range decrypts on its own
+    ctr_iv = b'\x00' * 8 + b'\xff' * 8  # wraps the low 64 bits inside the message
+    pt = os.urandom(5000)
+    ctr = AES_CTR(key, ctr_iv, counter_bits=128)
+    ct = ctr.crypt(pt, 0)
+    expected = _openssl_enc("ctr", key, ctr_iv, pt)
+    if expected is not None:
+        report("CTR 128-bit counter vs openssl", ct == expected)
+    ranges = [(0, 5000), (7, 8), (15, 33), (1000, 4097), (4999, 5000)]
+    report("CTR random-access byte ranges", all(ctr.crypt(ct[a:b], a) == pt[a:b] for a, b in ranges))
+    wrapped = AES_CTR(key, b'\x01' * 12 + b'\xff' * 4, counter_bits=32).keystream(16, 16)
+    report("CTR 32-bit counter wraps into the same prefix",
+           wrapped == AES_CTR(key, b'\x01' * 12, counter_bits=32).keystream(0, 16))
+
+    # Keystream ring buffer: every message decrypts at its returned offset
+    for refill in ("background", "manual"):
+        with AES_CTR(key, ctr_iv, counter_bits=128).prefetcher(depth=32, batch_blocks=8, refill=refill) as pre:
+            messages = [os.urandom(n) for n in (0, 5, 16, 100, 700, 3)]
+            sealed = [pre.encrypt(m) for m in messages]
+        ok = all(ctr.crypt(c, offset) == m for m, (offset, c) in zip(messages, sealed))
+        report(f"CTR keystream prefetcher, {refill} refill", ok)
+
+    # The prefetcher owns the counter space: the parent cannot reuse its keystream
+    owner = AES_CTR(key, ctr_iv, counter_bits=128)
+    with owner.prefetcher(refill="manual") as pre:
+        pre.encrypt(b'A' * 16)
+        reuses = [
+            ("CTR prefetcher blocks crypt without offset", lambda: owner.crypt(b'B' * 16)),
+            ("CTR prefetcher blocks a second prefetcher", lambda: owner.prefetcher(refill="manual")),
+        ]
+        for name, reuse in reuses:
+            try:
+                reuse()
+                report(name, False)
+            except ValueError:
+                report(name, True)
+
+    # A closed prefetcher raises instead of waiting for a refill that never comes
+    pre = AES_CTR(key, ctr_iv, counter_bits=128).prefetcher(depth=4, refill="background")
+    pre.close()
+    try:
+        pre.encrypt(b'x' * 1000)
+        report("CTR prefetcher raises after close", False)
+    except ValueError:
+        report("CTR prefetcher raises after close", True)
+
+    # Key-context cache: LRU eviction and hit/miss counters
+    cache = KeyContextCache(maxsize=2)
+    keys = [os.urandom(16) for _ in range(3)]
+    first = cached_backend(keys[0], cache=cache)
+    ok = cached_backend(keys[0], cache=cache) is first
+    for k in keys[1:]:
+        cached_backend(k, cache=cache)
+    ok = ok and cached_backend(keys[0], cache=cache) is not first
+    report("Key cache LRU eviction and counters", ok and cache.stats()["hits"] == 1 and len(cache) == 2)
+
+    try:
+        encrypt_cbc_into(pt, bytearray(len(pt)), key, iv)
+        report("CBC encrypt_into rejects short output", False)
+    except ValueError:
+        report("CBC encrypt_into rejects short output", True)
+
+
+if __name__ == "__main__":
+    run_test()
@@ -0,0 +1,71 @@
+from .aes_ocb import AES_OCB
+from src_py.aes import available_backends
+
+
+def _iterative_vector(key_len: int, tag_len: int, backend: str) -> str:
+    """RFC 7253 Appendix A iterative test: 384 encryptions of growing inputs, then one over their outputs."""
+    ocb = AES_OCB(bytes(key_len - 1) + bytes([tag_len * 8]), tag_len, backend)
+    output = b''
+    for i in range(128):
+        s = bytes(i)
+        for j, (aad, pt) in enumerate(((s, s), (b'', s), (s, b''))):
+            ct, tag = ocb.encrypt((3 * i + 1 + j).to_bytes(12, 'big'), aad, pt)
+            output += ct + tag
+    ct, tag = ocb.encrypt((385).to_bytes(12, 'big'), output, b'')
+    return (ct + tag).hex()
+
+
+def run_test():
+    # RFC 7253 Appendix A, AEAD_AES_128_OCB_TAGLEN128, K = 000102...0F
+    key = bytes(range(16))
+    block = "000102030405060708090a0b0c0d0e0f"
+    block24 = block + "1011121314151617"
+    vectors = [
+        ("RFC 7253 N=..00: empty A, empty P", "bbaa99887766554433221100", "", "",
+         "785407bfffc8ad9edcc5520ac9111ee6"),
+        ("RFC 7253 N=..01: 8-byte A, 8-byte P", "bbaa99887766554433221101", block[:16], block[:16],
+         "6820b3657b6f615a5725bda0d3b4eb3a257c9af1f8f03009"),
+        ("RFC 7253 N=..02: 8-byte A, empty P", "bbaa99887766554433221102", block[:16], "",
+         "81017f8203f081277152fade694a0a00"),
+        ("RFC 7253 N=..03: empty A, 8-byte P", "bbaa99887766554433221103", "", block[:16],
+         "45dd69f8f5aae72414054cd1f35d82760b2cd00d2f99bfa9"),
+        ("RFC 7253 N=..04: 16-byte A, 16-byte P", "bbaa99887766554433221104", block, block,
+         "571d535b60b277188be5147170a9a22c3ad7a4ff3835b8c5701c1ccec8fc3358"),
+        ("RFC 7253 N=..06: empty A, 16-byte P", "bbaa99887766554433221106", "", block,
+         "5ce88ec2e0692706a915c00aeb8b2396f40e1c743f52436bdf06d8fa1eca343d"),
+        ("RFC 7253 N=..07: 24-byte A, 24-byte P", "bbaa99887766554433221107", block24, block24,
+         "1ca2207308c87c010756104d8840ce1952f09673a448a122c92c62241051f57356d7f3c90bb0e07f"),
+    ]
+
+    print(f"{'TEST NAME':<65} | {'BACKEND':<10} | {'ENC':<6} | {'DEC':<6}")
+
+    for backend in available_backends():
+        ocb = AES_OCB(key, backend=backend)
+        for name, nonce, aad, pt, expected in vectors:
+            nonce, aad, pt = bytes.fromhex(nonce), bytes.fromhex(aad), bytes.fromhex(pt)
+            ct, tag = ocb.encrypt(nonce, aad, pt)
+            enc_check = "PASS" if (ct + tag).hex() == expected else "FAIL"
+
+            dec_check = "PASS" if ocb.decrypt(nonce, aad, ct, tag) == pt else "FAIL"
+            try:
+                ocb.decrypt(nonce, aad + b'\x00', ct, tag)
+                dec_check = "FAIL"
+            except ValueError:
+                pass
+            print(f"{name:<65} | {backend:<10} | {enc_check:<6} | {dec_check:<6}")
+
+    # Iterative vectors cover every length from 0 to 127 bytes, both key sizes and short tags
+    for key_len, tag_len, expected in [
+        (16, 16, "67e944d23256c5e0b6c61fa22fdf1ea2"),
+        (16, 12, "77a3d8e73589158d25d01209"),
+        (16, 8, "192c9b7bd90ba06a"),
+        (24, 16, "f673f2c3e7174aae7bae986ca9f29e17"),
+        (32, 16, "d90eb8e9c977c88b79dd793d7ffa161c"),
+    ]:
+        check = "PASS" if _iterative_vector(key_len, tag_len, "auto") == expected else "FAIL"
+        name = f"RFC 7253 iterative, AES-{key_len * 8}, {tag_len * 8}-bit tag"
+        print(f"{name:<65} | {'auto':<10} | {check:<6} | {'-':<6}")
+
+
+if __name__ == "__main__":
+    run_test()
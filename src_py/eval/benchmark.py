@@ -1,8 +1,15 @@
+import os
+import sys
 import time
 from typing import Callable, Tuple, Any, List
 
+from src_py.aes import AES, AES_TTable
 from src_py.aes_ops.aes_gcm import AES_GCM
+from src_py.aes_ops.aes_gcm_parallel import AES_GCM_Parallel
+from src_py.aes_ops.aes_ocb import AES_OCB
+from src_py.aes_ops.buffer_ops import xor_bytes, xor_bytes_reference, xor_into
 from src_py.aes_ops import encrypt_ecb, decrypt_ecb, encrypt_cbc, decrypt_cbc
+from src_py.aes_ops import encrypt_ecb_aes, decrypt_ecb_aes, encrypt_ecb_parallel, decrypt_ecb_parallel
 from src_py.eval.config_loader import load_config
 from src_py.eval.image_helper import load_image
 
@@ -32,6 +39,17 @@ class BenchmarkResult:
         return 0.0
 
 
+class KeySetupResult:
+    """Key schedule cost vs per-block cost of one AES engine."""
+
+    def __init__(self, engine_name: str, key_size: int):
+        self.engine_name = engine_name
+        self.key_size = key_size
+        self.setup_time: float = 0.0
+        self.encrypt_block_time: float = 0.0
+        self.decrypt_block_time: float = 0.0
+
+
 def benchmark_time(operation: Callable, *args, **kwargs) -> Tuple[float, Any]:
     """Measure execution time of a single operation.
 
@@ -70,6 +88,31 @@ def benchmark_ecb_performance(config) -> BenchmarkResult:
     return result
 
 
+def benchmark_ecb_aes_performance(config, parallel: bool = False) -> BenchmarkResult:
+    """Benchmark real AES-ECB: the raw multi-block throughput of the cipher (optionally multi-process)."""
+    img_data = load_image(config.image_path)
+    result = BenchmarkResult("ECB_PAR" if parallel else "ECB_AES", img_data.total_bytes)
+
+    if parallel:
+        workers = config.crypto.workers or None
+        encrypt = lambda: encrypt_ecb_parallel(config.crypto.key, img_data.plaintext, workers,
+                                               config.crypto.backend)
+        decrypt = lambda ct: decrypt_ecb_parallel(config.crypto.key, ct, workers, config.crypto.backend)
+    else:
+        encrypt = lambda: encrypt_ecb_aes(config.crypto.key, img_data.plaintext, config.crypto.backend)
+        decrypt = lambda ct: decrypt_ecb_aes(config.crypto.key, ct, config.crypto.backend)
+
+    # Encryption
+    result.encrypt_time, ciphertext = benchmark_time(encrypt)
+
+    # Decryption
+    result.decrypt_time, pt_dec = benchmark_time(decrypt, ciphertext)
+
+    # Correctness
+    result.correct_decrypt = (pt_dec == img_data.plaintext)
+    return result
+
+
 def benchmark_cbc_performance(config) -> BenchmarkResult:
     """Benchmark CBC mode performance."""
     img_data = load_image(config.image_path)
@@ -77,7 +120,7 @@ def benchmark_cbc_performance(config) -> BenchmarkResult:
 
     # Encryption (trả về (ciphertext, iv_used))
     def encrypt_wrapper():
-        return encrypt_cbc(img_data.plaintext, config.crypto.key, iv=None)
+        return encrypt_cbc(img_data.plaintext, config.crypto.key, iv=None, backend=config.crypto.backend)
 
     result.encrypt_time, (ciphertext, iv_used) = benchmark_time(encrypt_wrapper)
 
@@ -87,6 +130,7 @@ def benchmark_cbc_performance(config) -> BenchmarkResult:
         ciphertext,
         config.crypto.key,
         iv_used,
+        backend=config.crypto.backend,
     )
 
     # Correctness
@@ -104,6 +148,7 @@ def benchmark_gcm_performance(config) -> BenchmarkResult:
         config.crypto.iv_gcm,
         config.crypto.aad,
         config.crypto.tag_length,
+        backend=config.crypto.backend,
     )
 
     # Encryption
@@ -124,6 +169,216 @@ def benchmark_gcm_performance(config) -> BenchmarkResult:
     return result
 
 
+def benchmark_ocb_performance(config) -> BenchmarkResult:
+    """Benchmark OCB3 mode performance (same nonce, AAD and tag length as GCM)."""
+    img_data = load_image(config.image_path)
+    result = BenchmarkResult("OCB", img_data.total_bytes)
+
+    ocb = AES_OCB(config.crypto.key, config.crypto.tag_length, backend=config.crypto.backend)
+
+    # Encryption
+    result.encrypt_time, (ciphertext, tag) = benchmark_time(
+        ocb.encrypt,
+        config.crypto.iv_gcm,
+        config.crypto.aad,
+        img_data.plaintext,
+    )
+
+    # Decryption
+    result.decrypt_time, pt_dec = benchmark_time(
+        ocb.decrypt,
+        config.crypto.iv_gcm,
+        config.crypto.aad,
+        ciphertext,
+        tag,
+    )
+
+    # Correctness
+    result.correct_decrypt = (pt_dec == img_data.plaintext)
+    return result
+
+
+def benchmark_key_setup(config, engines=(AES, AES_TTable),
+                        key_repeats: int = 200, block_repeats: int = 2000) -> List[KeySetupResult]:
+    """Measure key setup and per-block encrypt/decrypt cost separately for each engine."""
+    key = config.crypto.key
+    block = bytes(16)
+    results = []
+
+    for engine in engines:
+        result = KeySetupResult(engine.__name__, len(key))
+
+        elapsed, _ = benchmark_time(lambda: [engine(key) for _ in range(key_repeats)])
+        result.setup_time = elapsed / key_repeats
+
+        aes = engine(key)
+        elapsed, _ = benchmark_time(lambda: [aes.encrypt(block) for _ in range(block_repeats)])
+        result.encrypt_block_time = elapsed / block_repeats
+        elapsed, _ = benchmark_time(lambda: [aes.decrypt(block) for _ in range(block_repeats)])
+        result.decrypt_block_time = elapsed / block_repeats
+
+        results.append(result)
+
+    return results
+
+
+def print_key_setup_summary(results: List[KeySetupResult]) -> None:
+    """Print key setup vs per-block costs (microseconds) for each engine."""
+    print("\n" + "=" * 70)
+    print("AES KEY SETUP VS PER-BLOCK COST (us)")
+    print("=" * 70)
+
+    header = (
+        f"{'Engine':<14}"
+        f"{'Key bits':>10}"
+        f"{'Key setup':>14}"
+        f"{'Enc/block':>14}"
+        f"{'Dec/block':>14}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for r in results:
+        row = (
+            f"{r.engine_name:<14}"
+            f"{r.key_size * 8:>10d}"
+            f"{r.setup_time * 1e6:>14.2f}"
+            f"{r.encrypt_block_time * 1e6:>14.2f}"
+            f"{r.decrypt_block_time * 1e6:>14.2f}"
+        )
+        print(row)
+
+    print("=" * 70 + "\n")
+
+
+def benchmark_xor(sizes=(16, 1024, 64 * 1024, 1024 * 1024), min_bytes: int = 4 * 1024 * 1024) -> List[Tuple[int, float, float, float]]:
+    """
+    Measure per-byte XOR cost of the old byte-by-byte XOR vs the whole-buffer kernels.
+
+    Returns
+    -------
+    List[Tuple[int, float, float, float]]
+        (size, reference ns/byte, xor_bytes ns/byte, xor_into ns/byte) per buffer size.
+    """
+    results = []
+    for size in sizes:
+        a = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        b = bytes(reversed(a))
+        dst = bytearray(a)
+        repeats = max(1, min_bytes // size)
+
+        ref_time, _ = benchmark_time(lambda: [xor_bytes_reference(a, b) for _ in range(max(1, repeats // 16))])
+        new_time, _ = benchmark_time(lambda: [xor_bytes(a, b) for _ in range(repeats)])
+        into_time, _ = benchmark_time(lambda: [xor_into(dst, b) for _ in range(repeats)])
+
+        results.append((
+            size,
+            ref_time / (max(1, repeats // 16) * size) * 1e9,
+            new_time / (repeats * size) * 1e9,
+            into_time / (repeats * size) * 1e9,
+        ))
+    return results
+
+
+def print_xor_summary(results: List[Tuple[int, float, float, float]]) -> None:
+    """Print per-byte XOR cost (ns/byte) before and after the buffer-ops kernels."""
+    print("\n" + "=" * 60)
+    print("XOR COST PER BYTE (ns)")
+    print("=" * 60)
+
+    header = (
+        f"{'Size (bytes)':>14}"
+        f"{'Byte loop':>14}"
+        f"{'xor_bytes':>14}"
+        f"{'xor_into':>14}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for size, ref_ns, new_ns, into_ns in results:
+        print(f"{size:>14,d}{ref_ns:>14.3f}{new_ns:>14.3f}{into_ns:>14.3f}")
+
+    print("=" * 60 + "\n")
+
+
+def benchmark_gcm_parallel_performance(config) -> BenchmarkResult:
+    """Benchmark multi-process GCM performance."""
+    img_data = load_image(config.image_path)
+    result = BenchmarkResult("GCM_PAR", img_data.total_bytes)
+
+    with AES_GCM_Parallel(
+        config.crypto.key,
+        config.crypto.iv_gcm,
+        config.crypto.aad,
+        config.crypto.tag_length,
+        backend=config.crypto.backend,
+        workers=config.crypto.workers or None,
+    ) as gcm:
+        # Encryption
+        result.encrypt_time, (ciphertext, tag) = benchmark_time(
+            gcm.encrypt_gcm,
+            img_data.plaintext,
+        )
+
+        # Decryption
+        result.decrypt_time, pt_dec = benchmark_time(
+            gcm.decrypt_gcm,
+            ciphertext,
+            tag,
+        )
+
+    # Correctness
+    result.correct_decrypt = (pt_dec == img_data.plaintext)
+    return result
+
+
+def benchmark_scaling(config, sizes=(1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)) -> List[BenchmarkResult]:
+    """Encrypt/decrypt random payloads of growing size; linear-time modes keep a flat MB/s."""
+    results = []
+    key = config.crypto.key
+    backend = config.crypto.backend
+
+    for size in sizes:
+        plaintext = os.urandom(size)
+
+        result = BenchmarkResult("ECB_XOR", size)
+        result.encrypt_time, ciphertext = benchmark_time(encrypt_ecb, key, plaintext)
+        result.decrypt_time, pt_dec = benchmark_time(decrypt_ecb, key, ciphertext)
+        result.correct_decrypt = (pt_dec == plaintext)
+        results.append(result)
+
+        result = BenchmarkResult("ECB_AES", size)
+        result.encrypt_time, ciphertext = benchmark_time(encrypt_ecb_aes, key, plaintext, backend)
+        result.decrypt_time, pt_dec = benchmark_time(decrypt_ecb_aes, key, ciphertext, backend)
+        result.correct_decrypt = (pt_dec == plaintext)
+        results.append(result)
+
+        result = BenchmarkResult("CBC", size)
+        result.encrypt_time, (ciphertext, iv_used) = benchmark_time(
+            encrypt_cbc, plaintext, key, iv=None, backend=backend)
+        result.decrypt_time, pt_dec = benchmark_time(decrypt_cbc, ciphertext, key, iv_used, backend=backend)
+        result.correct_decrypt = (pt_dec == plaintext)
+        results.append(result)
+
+        gcm = AES_GCM(key, config.crypto.iv_gcm, config.crypto.aad, config.crypto.tag_length, backend=backend)
+        result = BenchmarkResult("GCM", size)
+        result.encrypt_time, (ciphertext, tag) = benchmark_time(gcm.encrypt_gcm, plaintext)
+        result.decrypt_time, pt_dec = benchmark_time(gcm.decrypt_gcm, ciphertext, tag)
+        result.correct_decrypt = (pt_dec == plaintext)
+        results.append(result)
+
+        ocb = AES_OCB(key, config.crypto.tag_length, backend=backend)
+        result = BenchmarkResult("OCB", size)
+        result.encrypt_time, (ciphertext, tag) = benchmark_time(
+            ocb.encrypt, config.crypto.iv_gcm, config.crypto.aad, plaintext)
+        result.decrypt_time, pt_dec = benchmark_time(
+            ocb.decrypt, config.crypto.iv_gcm, config.crypto.aad, ciphertext, tag)
+        result.correct_decrypt = (pt_dec == plaintext)
+        results.append(result)
+
+    return results
+
+
 def print_performance_summary(results: List[BenchmarkResult]) -> None:
     """Print a single consolidated performance table for all modes."""
     if not results:
@@ -167,12 +422,27 @@ def run_performance_benchmark() -> None:
 
     results: List[BenchmarkResult] = [
         benchmark_ecb_performance(config),
+        benchmark_ecb_aes_performance(config),
+        benchmark_ecb_aes_performance(config, parallel=True),
         benchmark_cbc_performance(config),
         benchmark_gcm_performance(config),
+        benchmark_gcm_parallel_performance(config),
+        benchmark_ocb_performance(config),
     ]
 
     print_performance_summary(results)
+    print_key_setup_summary(benchmark_key_setup(config))
+    print_xor_summary(benchmark_xor())
+
+
+def run_scaling_benchmark() -> None:
+    """Run the 1 KB to 100 MB scaling benchmark for all encryption modes."""
+    config = load_config()
+    print_performance_summary(benchmark_scaling(config))
 
 
 if __name__ == "__main__":
-    run_performance_benchmark()
+    if "--scaling" in sys.argv:
+        run_scaling_benchmark()
+    else:
+        run_performance_benchmark()
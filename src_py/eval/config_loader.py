@@ -12,6 +12,8 @@ class CryptoConfig:
     aad: bytes
     tag_length: int
     block_size: int
+    backend: str = "auto"
+    workers: int = 0
 
 
 @dataclass
@@ -57,7 +59,9 @@ def load_config(config_path: str = "config.yaml") -> Config:
         iv_gcm=crypto_data['iv_gcm'].encode('utf-8'),
         aad=crypto_data['aad'].encode('utf-8'),
         tag_length=crypto_data['tag_length'],
-        block_size=crypto_data['block_size']
+        block_size=crypto_data['block_size'],
+        backend=crypto_data.get('backend', 'auto'),
+        workers=crypto_data.get('workers', 0)
     )
 
     # Parse MITM config